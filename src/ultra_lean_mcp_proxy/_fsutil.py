@@ -0,0 +1,18 @@
+"""Filesystem helpers shared by the config loader and the installer."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Optional
+
+# Files modified this recently are never cached: an in-place rewrite of the
+# same size can land within one filesystem timestamp tick and look unchanged.
+_STAT_CACHE_RACY_WINDOW_NS = 2_000_000_000
+
+
+def stable_stat_signature(st: os.stat_result) -> Optional[tuple[int, int, int]]:
+    """Return a cache signature for a stat result, or None if too fresh to trust."""
+    if time.time_ns() - st.st_mtime_ns <= _STAT_CACHE_RACY_WINDOW_NS:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
+
+from ._fsutil import stable_stat_signature
+from .tools_hash_sync import TOOLS_HASH_ALGORITHMS
 
 
 def _parse_bool(value: Any, default: Optional[bool] = None) -> Optional[bool]:
@@ -34,11 +38,33 @@ def _deep_merge_dict(base: dict, override: dict) -> dict:
     return merged
 
 
-def _read_config_file(path: str) -> dict[str, Any]:
-    data = Path(path).read_text(encoding="utf-8")
-    suffix = Path(path).suffix.lower()
-    if suffix == ".json":
-        parsed = json.loads(data)
+_CONFIG_FILE_CACHE: dict[str, tuple[Optional[tuple[int, int, int]], bytes, dict[str, Any]]] = {}
+
+
+def _load_config_file(path: str) -> dict[str, Any]:
+    """Return parsed config file data, cached against the file's stat signature.
+
+    When the signature changes but the bytes do not (touch, editor re-save),
+    the previous parse is reused without decoding again.
+    """
+    key = os.path.abspath(path)
+    signature = stable_stat_signature(os.stat(key))
+    cached = _CONFIG_FILE_CACHE.get(key)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[2])
+
+    raw = Path(path).read_bytes()
+    if cached is not None and cached[1] == raw:
+        parsed = cached[2]
+    else:
+        parsed = _parse_config_bytes(raw, Path(path).suffix.lower())
+    _CONFIG_FILE_CACHE[key] = (signature, raw, parsed)
+    return copy.deepcopy(parsed)
+
+
+def _parse_config_bytes(raw: bytes, suffix: str) -> dict[str, Any]:
+    if not raw.strip():
+        parsed: Any = {}
     elif suffix in {".yml", ".yaml"}:
         try:
             import yaml  # type: ignore
@@ -47,16 +73,17 @@ def _read_config_file(path: str) -> dict[str, Any]:
                 "YAML config requested but PyYAML is not installed. "
                 "Install `pyyaml` or use JSON config."
             ) from exc
-        parsed = yaml.safe_load(data) or {}
+        parsed = yaml.safe_load(raw.decode("utf-8")) or {}
     else:
-        # Default to JSON for deterministic behavior without extra deps.
-        parsed = json.loads(data)
+        # JSON, and the default for unknown suffixes for deterministic
+        # behavior without extra deps. json.loads decodes bytes directly.
+        parsed = json.loads(raw)
     if not isinstance(parsed, dict):
         raise ValueError("Proxy config must be a mapping object")
     return parsed
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyConfig:
     """Resolved proxy runtime config after file/env/CLI merge."""
 
@@ -332,100 +359,65 @@ def _apply_global_config(
     return cfg
 
 
-def _apply_env(cfg: ProxyConfig, env: Mapping[str, str]) -> ProxyConfig:
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_STATS")) is not None:
-        cfg.stats = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_STATS")))
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_VERBOSE")) is not None:
-        cfg.verbose = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_VERBOSE")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_SESSION_ID"):
-        cfg.session_id = env["ULTRA_LEAN_MCP_PROXY_SESSION_ID"]
-
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION")) is not None:
-        cfg.result_compression_enabled = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION_MODE"):
-        cfg.result_compression_mode = env["ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION_MODE"]
-    if env.get("ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_ABS"):
-        try:
-            cfg.result_min_token_savings_abs = max(0, int(env["ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_ABS"]))
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_RATIO"):
-        try:
-            ratio = float(env["ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_RATIO"])
-            cfg.result_min_token_savings_ratio = min(max(ratio, 0.0), 1.0)
-        except ValueError:
-            pass
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_SHARED_KEY_REGISTRY")) is not None:
-        cfg.result_shared_key_registry = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_SHARED_KEY_REGISTRY")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_RESULT_KEY_BOOTSTRAP_INTERVAL"):
-        try:
-            cfg.result_key_bootstrap_interval = max(0, int(env["ULTRA_LEAN_MCP_PROXY_RESULT_KEY_BOOTSTRAP_INTERVAL"]))
-        except ValueError:
-            pass
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_MINIFY_REDUNDANT_TEXT")) is not None:
-        cfg.result_minify_redundant_text = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_RESULT_MINIFY_REDUNDANT_TEXT")))
+def _env_bool(raw: str) -> bool:
+    parsed = _parse_bool(raw)
+    if parsed is None:
+        raise ValueError(f"not a boolean: {raw!r}")
+    return parsed
 
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_DELTA_RESPONSES")) is not None:
-        cfg.delta_responses_enabled = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_DELTA_RESPONSES")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_DELTA_MIN_SAVINGS"):
-        try:
-            cfg.delta_min_savings_ratio = min(max(float(env["ULTRA_LEAN_MCP_PROXY_DELTA_MIN_SAVINGS"]), 0.0), 1.0)
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_DELTA_MAX_PATCH_RATIO"):
-        try:
-            ratio = float(env["ULTRA_LEAN_MCP_PROXY_DELTA_MAX_PATCH_RATIO"])
-            cfg.delta_max_patch_ratio = min(max(ratio, 0.0), 1.0)
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_DELTA_MIN_RESULT_TOKENS"):
-        try:
-            cfg.delta_min_result_tokens = max(0, int(env["ULTRA_LEAN_MCP_PROXY_DELTA_MIN_RESULT_TOKENS"]))
-        except ValueError:
-            pass
 
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_LAZY_LOADING")) is not None:
-        cfg.lazy_loading_enabled = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_LAZY_LOADING")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_LAZY_MODE"):
-        cfg.lazy_mode = env["ULTRA_LEAN_MCP_PROXY_LAZY_MODE"]
-    if env.get("ULTRA_LEAN_MCP_PROXY_SEARCH_TOP_K"):
-        try:
-            cfg.lazy_top_k = max(1, int(env["ULTRA_LEAN_MCP_PROXY_SEARCH_TOP_K"]))
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOOLS"):
-        try:
-            cfg.lazy_min_tools = max(0, int(env["ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOOLS"]))
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOKENS"):
-        try:
-            cfg.lazy_min_tokens = max(0, int(env["ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOKENS"]))
-        except ValueError:
-            pass
-    if env.get("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_CONFIDENCE"):
-        try:
-            cfg.lazy_min_confidence_score = float(env["ULTRA_LEAN_MCP_PROXY_LAZY_MIN_CONFIDENCE"])
-        except ValueError:
-            pass
+def _env_int_at_least(minimum: int) -> Callable[[str], int]:
+    return lambda raw: max(minimum, int(raw))
+
+
+def _env_unit_float(raw: str) -> float:
+    return min(max(float(raw), 0.0), 1.0)
+
+
+def _env_str(raw: str) -> str:
+    return raw
+
+
+# (env var, ProxyConfig attribute, parser). Unset or empty variables are
+# ignored, and so are values the parser rejects with ValueError.
+_ENV_SPECS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("ULTRA_LEAN_MCP_PROXY_STATS", "stats", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_VERBOSE", "verbose", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_SESSION_ID", "session_id", _env_str),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION", "result_compression_enabled", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_COMPRESSION_MODE", "result_compression_mode", _env_str),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_ABS", "result_min_token_savings_abs", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_MIN_TOKEN_SAVINGS_RATIO", "result_min_token_savings_ratio", _env_unit_float),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_SHARED_KEY_REGISTRY", "result_shared_key_registry", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_KEY_BOOTSTRAP_INTERVAL", "result_key_bootstrap_interval", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_RESULT_MINIFY_REDUNDANT_TEXT", "result_minify_redundant_text", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_DELTA_RESPONSES", "delta_responses_enabled", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_DELTA_MIN_SAVINGS", "delta_min_savings_ratio", _env_unit_float),
+    ("ULTRA_LEAN_MCP_PROXY_DELTA_MAX_PATCH_RATIO", "delta_max_patch_ratio", _env_unit_float),
+    ("ULTRA_LEAN_MCP_PROXY_DELTA_MIN_RESULT_TOKENS", "delta_min_result_tokens", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_LAZY_LOADING", "lazy_loading_enabled", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_LAZY_MODE", "lazy_mode", _env_str),
+    ("ULTRA_LEAN_MCP_PROXY_SEARCH_TOP_K", "lazy_top_k", _env_int_at_least(1)),
+    ("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOOLS", "lazy_min_tools", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_TOKENS", "lazy_min_tokens", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_LAZY_MIN_CONFIDENCE", "lazy_min_confidence_score", float),
+    ("ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_SYNC", "tools_hash_sync_enabled", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_REFRESH_INTERVAL", "tools_hash_sync_refresh_interval", _env_int_at_least(1)),
+    ("ULTRA_LEAN_MCP_PROXY_CACHING", "caching_enabled", _env_bool),
+    ("ULTRA_LEAN_MCP_PROXY_CACHE_TTL_SECONDS", "cache_ttl_seconds", _env_int_at_least(0)),
+    ("ULTRA_LEAN_MCP_PROXY_CACHE_ADAPTIVE_TTL", "cache_adaptive_ttl", _env_bool),
+)
 
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_SYNC")) is not None:
-        cfg.tools_hash_sync_enabled = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_SYNC")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_REFRESH_INTERVAL"):
-        try:
-            cfg.tools_hash_sync_refresh_interval = max(1, int(env["ULTRA_LEAN_MCP_PROXY_TOOLS_HASH_REFRESH_INTERVAL"]))
-        except ValueError:
-            pass
 
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_CACHING")) is not None:
-        cfg.caching_enabled = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_CACHING")))
-    if env.get("ULTRA_LEAN_MCP_PROXY_CACHE_TTL_SECONDS"):
+def _apply_env(cfg: ProxyConfig, env: Mapping[str, str]) -> ProxyConfig:
+    for env_name, attr, parse in _ENV_SPECS:
+        raw = env.get(env_name)
+        if not raw:
+            continue
         try:
-            cfg.cache_ttl_seconds = max(0, int(env["ULTRA_LEAN_MCP_PROXY_CACHE_TTL_SECONDS"]))
+            setattr(cfg, attr, parse(raw))
         except ValueError:
             pass
-    if _parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_CACHE_ADAPTIVE_TTL")) is not None:
-        cfg.cache_adaptive_ttl = bool(_parse_bool(env.get("ULTRA_LEAN_MCP_PROXY_CACHE_ADAPTIVE_TTL")))
     return cfg
 
 
@@ -480,7 +472,7 @@ def load_proxy_config(
 
     resolved_path = config_path or cli.get("config_path") or env_map.get("ULTRA_LEAN_MCP_PROXY_CONFIG")
     if resolved_path:
-        config_data = _read_config_file(resolved_path)
+        config_data = _load_config_file(resolved_path)
         cfg = _apply_global_config(cfg, config_data, upstream_command)
         cfg.source_path = resolved_path
 
@@ -491,7 +483,7 @@ def load_proxy_config(
         raise ValueError(f"Invalid lazy mode: {cfg.lazy_mode}")
     if cfg.result_compression_mode not in {"off", "balanced", "aggressive"}:
         raise ValueError(f"Invalid result compression mode: {cfg.result_compression_mode}")
-    if cfg.tools_hash_sync_algorithm != "sha256":
+    if cfg.tools_hash_sync_algorithm not in TOOLS_HASH_ALGORITHMS:
         raise ValueError(f"Invalid tools hash sync algorithm: {cfg.tools_hash_sync_algorithm}")
     if cfg.cache_ttl_max_seconds < cfg.cache_ttl_min_seconds:
         cfg.cache_ttl_max_seconds = cfg.cache_ttl_min_seconds
@@ -8,8 +8,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+from itertools import compress
+from operator import is_not
 from typing import Any, Optional
 
+from .state import JSON_SCALAR_TYPES, clone_json as _clone_json
+
+DELTA_ENCODING = "lapc-delta-v1"
+
 
 def canonicalize(value: Any) -> Any:
     """Canonicalize JSON-like data for stable hashing/diffing."""
@@ -20,51 +26,109 @@ def canonicalize(value: Any) -> Any:
     return value
 
 
-def _clone_json(value: Any) -> Any:
-    return json.loads(json.dumps(value))
+def stable_hash(value: Any) -> str:
+    return hashlib.sha256(_canonical_bytes(value)).hexdigest()
+
 
+def _canonical_bytes(value: Any) -> bytes:
+    """Serialize to canonical JSON bytes.
 
-def stable_hash(value: Any) -> str:
-    text = json.dumps(canonicalize(value), separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    sort_keys runs inside the C encoder and yields the same text as dumping
+    canonicalize(value), without building the sorted copy first.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def _json_bytes(value: Any) -> int:
     return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
 
 
-def _deep_equal(a: Any, b: Any) -> bool:
-    return json.dumps(canonicalize(a), separators=(",", ":")) == json.dumps(
-        canonicalize(b), separators=(",", ":")
-    )
+def _leaf_equal(a: Any, b: Any) -> bool:
+    """Compare scalars the way their JSON text would (1 != 1.0 != True)."""
+    if type(a) is not type(b):
+        return False
+    if type(a) is float:
+        return repr(a) == repr(b)
+    return a == b
 
 
-def _diff_values(previous: Any, current: Any, path: list, ops: list) -> None:
-    """Recursively compute structural diff ops between two JSON values."""
-    if _deep_equal(previous, current):
-        return
+_MISSING = object()
 
-    if isinstance(previous, list) and isinstance(current, list):
-        if len(previous) != len(current):
-            ops.append({"op": "set", "path": list(path), "value": _clone_json(current)})
-            return
-        for i in range(len(current)):
-            _diff_values(previous[i], current[i], path + [i], ops)
-        return
+# Serialized size of each op without its path segments or value.
+_DELETE_OP_BYTES = len('{"op":"delete","path":[]}')
+_SET_OP_BYTES = len('{"op":"set","path":[],"value":}')
 
-    if isinstance(previous, dict) and isinstance(current, dict):
-        keys = sorted(set(list(previous.keys()) + list(current.keys())))
-        for key in keys:
-            if key not in current:
-                ops.append({"op": "delete", "path": path + [key]})
-                continue
-            if key not in previous:
-                ops.append({"op": "set", "path": path + [key], "value": _clone_json(current[key])})
+
+class _BudgetExceeded(Exception):
+    """Raised by _diff_values once the ops can no longer fit the byte budget."""
+
+
+def _op_bytes_lower_bound(op: dict[str, Any]) -> int:
+    """Cheap lower bound on an op's compact JSON size (plus its list comma)."""
+    size = max(len(op["path"]), 1)
+    for segment in op["path"]:
+        size += len(segment) + 2 if isinstance(segment, str) else len(str(segment))
+    if op["op"] == "delete":
+        return size + _DELETE_OP_BYTES
+    value = op["value"]
+    return size + _SET_OP_BYTES + (len(value) + 2 if isinstance(value, str) else 1)
+
+
+def _diff_values(
+    previous: Any,
+    current: Any,
+    path: list,
+    ops: list,
+    budget: Optional[float] = None,
+) -> None:
+    """Compute structural diff ops between two JSON values.
+
+    Walks both trees with an explicit stack instead of recursing; children
+    are pushed in reverse so ops come out in the same depth-first, sorted-key
+    order as a recursive walk. Shared subtrees are skipped by identity, and
+    equal containers simply produce no ops, so no subtree is serialized just
+    to compare it.
+
+    With a byte ``budget``, raises _BudgetExceeded as soon as a lower bound
+    on the serialized ops passes it, before any remaining ops are built.
+    """
+    estimated = 1
+    stack: list[tuple[Any, Any, tuple]] = [(previous, current, tuple(path))]
+    while stack:
+        prev, curr, at = stack.pop()
+        if curr is _MISSING:
+            op = {"op": "delete", "path": list(at)}
+        elif prev is _MISSING:
+            op = {"op": "set", "path": list(at), "value": _clone_json(curr)}
+        elif prev is curr:
+            continue
+        elif isinstance(prev, list) and isinstance(curr, list):
+            if len(prev) == len(curr):
+                # Drop identical element pairs in C before touching any in Python;
+                # equal scalars are settled here instead of via the stack.
+                changed = list(compress(range(len(curr)), map(is_not, prev, curr)))
+                for i in reversed(changed):
+                    a, b = prev[i], curr[i]
+                    if type(a) in JSON_SCALAR_TYPES and _leaf_equal(a, b):
+                        continue
+                    stack.append((a, b, at + (i,)))
                 continue
-            _diff_values(previous[key], current[key], path + [key], ops)
-        return
+            op = {"op": "set", "path": list(at), "value": _clone_json(curr)}
+        elif isinstance(prev, dict) and isinstance(curr, dict):
+            keys = sorted(set(list(prev.keys()) + list(curr.keys())))
+            for key in reversed(keys):
+                stack.append((prev.get(key, _MISSING), curr.get(key, _MISSING), at + (key,)))
+            continue
+        elif _leaf_equal(prev, curr):
+            continue
+        else:
+            op = {"op": "set", "path": list(at), "value": _clone_json(curr)}
 
-    ops.append({"op": "set", "path": list(path), "value": _clone_json(current)})
+        if budget is not None:
+            estimated += _op_bytes_lower_bound(op)
+            if estimated > budget:
+                raise _BudgetExceeded
+        ops.append(op)
 
 
 def create_delta(
@@ -74,18 +138,29 @@ def create_delta(
     max_patch_bytes: int = 65536,
 ) -> Optional[dict[str, Any]]:
     """Create a structural JSON diff envelope if it saves enough bytes."""
+    if previous is current:
+        return None
     canonical_previous = canonicalize(previous)
     canonical_current = canonicalize(current)
-    if _deep_equal(canonical_previous, canonical_current):
-        return None
+    # One serialization of the current payload feeds the byte budget,
+    # fullBytes and currentHash.
+    current_bytes = _canonical_bytes(canonical_current)
+    full_bytes = len(current_bytes)
 
+    # A patch larger than this fails max_patch_bytes or min_savings_ratio;
+    # the extra byte absorbs float rounding at the exact ratio boundary.
+    budget = float(max_patch_bytes)
+    if full_bytes > 0:
+        budget = min(budget, full_bytes * (1.0 - min_savings_ratio) + 1)
     ops: list[dict[str, Any]] = []
-    _diff_values(canonical_previous, canonical_current, [], ops)
+    try:
+        _diff_values(canonical_previous, canonical_current, [], ops, budget=budget)
+    except _BudgetExceeded:
+        return None
     if not ops:
         return None
 
     patch_bytes = _json_bytes(ops)
-    full_bytes = _json_bytes(canonical_current)
     if patch_bytes > max_patch_bytes:
         return None
 
@@ -94,9 +169,9 @@ def create_delta(
         return None
 
     return {
-        "encoding": "lapc-delta-v1",
+        "encoding": DELTA_ENCODING,
         "baselineHash": stable_hash(canonical_previous),
-        "currentHash": stable_hash(canonical_current),
+        "currentHash": hashlib.sha256(current_bytes).hexdigest(),
         "ops": ops,
         "patchBytes": patch_bytes,
         "fullBytes": full_bytes,
@@ -131,15 +206,21 @@ def _get_parent_for_path(root: Any, path: list) -> tuple[Any, Any]:
     return cursor, path[-1]
 
 
-def apply_delta(previous: Any, delta: dict[str, Any]) -> Any:
-    """Apply a structural JSON diff to a previous payload."""
-    if not isinstance(delta, dict) or delta.get("encoding") != "lapc-delta-v1":
+def apply_delta(previous: Any, delta: dict[str, Any], *, inplace: bool = False) -> Any:
+    """Apply a structural JSON diff to a previous payload.
+
+    By default ``previous`` is deep-copied first and left untouched. Callers
+    that own the baseline and discard it afterwards can pass ``inplace=True``
+    to patch it directly and skip that copy; always use the return value,
+    since a root-level op replaces the whole payload.
+    """
+    if not isinstance(delta, dict) or delta.get("encoding") != DELTA_ENCODING:
         raise ValueError("Unsupported delta envelope")
     ops = delta.get("ops")
     if not isinstance(ops, list):
         raise ValueError("Delta envelope missing ops")
 
-    output = _clone_json(previous)
+    output = previous if inplace else _clone_json(previous)
     for op in ops:
         if not isinstance(op, dict) or not isinstance(op.get("path"), list):
             raise ValueError("Invalid delta op")
@@ -7,6 +7,8 @@ MCP client configurations (Claude Desktop, Claude Code, Cursor, Windsurf, etc.).
 from __future__ import annotations
 
 import base64
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -15,11 +17,14 @@ import re
 import shutil
 import subprocess
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from ._fsutil import stable_stat_signature as _stable_stat_signature
+
 logger = logging.getLogger(__name__)
 
 REMOTE_REGISTRY_URL = (
@@ -35,11 +40,19 @@ LOCAL_OVERRIDES_FILE = DATA_DIR / "clients.json"
 ALLOWED_REGISTRY_KEYS = {"name", "paths", "key"}
 SAFE_PATH_PREFIXES = ("~", "%APPDATA%", "%USERPROFILE%", "$HOME")
 
-_SAFE_PROPERTY_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}$")
+_SAFE_PROPERTY_NAME_PATTERN = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}")
 _UNSAFE_PROPERTY_NAMES = frozenset(("__proto__", "constructor", "prototype"))
 _CLAUDE_LOCAL_SCOPE_PATTERN = re.compile(r"\b(local|user|project)\s+config\b", re.IGNORECASE)
-_CLAUDE_CLOUD_SCOPE_PATTERN = re.compile(r"\bcloud\b", re.IGNORECASE)
+# One scan classifies a scope label: group 1 is set for local-style matches.
+_CLAUDE_SCOPE_PATTERN = re.compile(r"\b(?:((?:local|user|project)\s+config)|cloud)\b", re.IGNORECASE)
 _ACCEPTED_URL_TRANSPORTS = frozenset(("sse", "http", "streamable-http"))
+# A tuple, not a frozenset: wrapped args may hold unhashable JSON values.
+_WRAPPED_RUNTIMES = ("pip", "npm")
+_CLAUDE_BLOCKED_ENV_VARS = frozenset(("CLAUDECODE", "CLAUDE_CODE"))
+_CLAUDE_LIST_NAME_PATTERN = re.compile(r"^([^:\r\n]+):\s+")
+_CLAUDE_GET_FIELD_PATTERN = re.compile(r"^\s{2}(Scope|Type|URL|Command|Args):\s*(.*)$")
+_CLAUDE_GET_HEADERS_PATTERN = re.compile(r"^\s{2}Headers:\s*$")
+_CLAUDE_GET_HEADER_LINE_PATTERN = re.compile(r"^\s{4}([^:]+):\s*(.*)$")
 
 
 # ---------------------------------------------------------------------------
@@ -232,12 +245,13 @@ def _fetch_remote_registry() -> list[dict]:
         return results
 
     def _load_cached_registry() -> list[dict]:
-        if not REGISTRY_CACHE_FILE.exists():
-            return []
         try:
-            cached_raw = REGISTRY_CACHE_FILE.read_text(encoding="utf-8")
-            cached_payload = json.loads(cached_raw)
+            # json.loads detects the UTF encoding of raw bytes itself, so the
+            # payload is parsed without an intermediate str decode.
+            cached_payload = json.loads(REGISTRY_CACHE_FILE.read_bytes())
             return _parse_registry_payload(cached_payload)
+        except FileNotFoundError:
+            return []
         except (OSError, json.JSONDecodeError, ValueError, KeyError) as exc:
             logger.debug("Failed to load cached registry payload: %s", exc)
             return []
@@ -290,11 +304,27 @@ def _fetch_remote_registry() -> list[dict]:
         return []
 
 
+# path -> ((st_ino, st_size, st_mtime_ns), parsed override locations)
+_LOCAL_OVERRIDES_CACHE: dict[str, tuple[tuple[int, int, int], list[dict]]] = {}
+
+
 def _load_local_overrides() -> list[dict]:
-    """Load user's local client overrides from ~/.ultra-lean-mcp-proxy/clients.json."""
-    if not LOCAL_OVERRIDES_FILE.exists():
+    """Load user's local client overrides from ~/.ultra-lean-mcp-proxy/clients.json.
+
+    Parsed results are cached against the file's stat signature, so repeated
+    lookups (install, then cloud discovery, then the watcher) skip the read.
+    """
+    try:
+        st = LOCAL_OVERRIDES_FILE.stat()
+    except OSError:
         return []
 
+    cache_key = str(LOCAL_OVERRIDES_FILE)
+    signature = _stable_stat_signature(st)
+    cached = _LOCAL_OVERRIDES_CACHE.get(cache_key)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return [dict(loc) for loc in cached[1]]
+
     try:
         raw = LOCAL_OVERRIDES_FILE.read_text(encoding="utf-8")
         data = json.loads(raw)
@@ -334,6 +364,8 @@ def _load_local_overrides() -> list[dict]:
                         }
                     )
 
+        if signature is not None:
+            _LOCAL_OVERRIDES_CACHE[cache_key] = (signature, [dict(loc) for loc in results])
         return results
 
     except (OSError, json.JSONDecodeError) as exc:
@@ -372,69 +404,72 @@ def get_config_locations(offline: bool = False) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+# A JSON string literal (kept; may be unterminated at EOF), a // line comment,
+# or a /* block comment */ (unterminated ones run to EOF).
+_JSONC_TOKEN_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"?)|//[^\n]*|/\*.*?(?:\*/|\Z)', re.DOTALL)
+
+
 def strip_jsonc_comments(text: str) -> str:
-    """Strip // and /* */ comments from JSONC using a state machine.
+    """Strip // and /* */ comments from JSONC in a single regex pass.
 
-    Correctly handles // inside string values (e.g. URLs) by tracking
-    whether we are inside a JSON string.
+    Correctly handles // inside string values (e.g. URLs): string literals
+    are matched as whole tokens and kept, only comment tokens are dropped.
     """
-    result: list[str] = []
-    i = 0
-    length = len(text)
-    in_string = False
-    escape = False
-
-    while i < length:
-        ch = text[i]
-
-        if in_string:
-            result.append(ch)
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            i += 1
-            continue
+    return _JSONC_TOKEN_PATTERN.sub(lambda m: m.group(1) or "", text)
 
-        # Not in a string
-        if ch == '"':
-            in_string = True
-            result.append(ch)
-            i += 1
-            continue
 
-        # Check for // line comment
-        if ch == "/" and i + 1 < length and text[i + 1] == "/":
-            # Skip until end of line
-            i += 2
-            while i < length and text[i] != "\n":
-                i += 1
-            continue
+# path -> ((st_ino, st_size, st_mtime_ns), comment-free JSON text)
+_READ_CONFIG_CACHE: dict[str, tuple[tuple[int, int, int], str]] = {}
+# blake2b(file bytes) -> comment-free JSON text, bounded LRU.  Content keys
+# cannot go stale, so this also serves files too fresh for the stat cache.
+_JSONC_TEXT_CACHE: OrderedDict[bytes, str] = OrderedDict()
+_JSONC_TEXT_CACHE_MAX_ENTRIES = 128
 
-        # Check for /* block comment */
-        if ch == "/" and i + 1 < length and text[i + 1] == "*":
-            i += 2
-            while i + 1 < length and not (text[i] == "*" and text[i + 1] == "/"):
-                i += 1
-            i += 2  # skip */
-            continue
 
-        result.append(ch)
-        i += 1
+def read_config(path: str) -> dict:
+    """Read a config file, handling JSONC comments.
 
-    return "".join(result)
+    The comment-free text is cached per path and keyed on inode, size and
+    mtime, so repeated reads of an unchanged file skip the disk read and the
+    JSONC pass.  Files seen with identical bytes before also skip the JSONC
+    pass.  Every call still returns a freshly parsed dict.
+    """
+    key = str(path)
+    signature = _stable_stat_signature(os.stat(key))
+    cached = _READ_CONFIG_CACHE.get(key)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return json.loads(cached[1])
+
+    raw_bytes = Path(path).read_bytes()
+    digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+    text = _JSONC_TEXT_CACHE.get(digest)
+    if text is not None:
+        _JSONC_TEXT_CACHE.move_to_end(digest)
+        data = json.loads(text)
+    else:
+        text = raw_bytes.decode("utf-8")
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            text = strip_jsonc_comments(text)
+            data = json.loads(text)
+        _JSONC_TEXT_CACHE[digest] = text
+        if len(_JSONC_TEXT_CACHE) > _JSONC_TEXT_CACHE_MAX_ENTRIES:
+            _JSONC_TEXT_CACHE.popitem(last=False)
+
+    if signature is not None:
+        _READ_CONFIG_CACHE[key] = (signature, text)
+    else:
+        _READ_CONFIG_CACHE.pop(key, None)
+    return data
 
 
-def read_config(path: str) -> dict:
-    """Read a config file, handling JSONC comments."""
-    raw = Path(path).read_text(encoding="utf-8")
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        stripped = strip_jsonc_comments(raw)
-        return json.loads(stripped)
+def _clear_read_config_caches() -> None:
+    _READ_CONFIG_CACHE.clear()
+    _JSONC_TEXT_CACHE.clear()
+
+
+read_config.cache_clear = _clear_read_config_caches  # type: ignore[attr-defined]
 
 
 # ---------------------------------------------------------------------------
@@ -486,11 +521,9 @@ def is_safe_property_name(name: str) -> bool:
 
     Rejects prototype pollution vectors and invalid characters.
     """
-    if not isinstance(name, str) or not name:
-        return False
-    if name in _UNSAFE_PROPERTY_NAMES:
+    if not isinstance(name, str) or name in _UNSAFE_PROPERTY_NAMES:
         return False
-    return bool(_SAFE_PROPERTY_NAME_PATTERN.match(name))
+    return _SAFE_PROPERTY_NAME_PATTERN.fullmatch(name) is not None
 
 
 def parse_claude_mcp_list_names(output: str) -> list[str]:
@@ -498,21 +531,17 @@ def parse_claude_mcp_list_names(output: str) -> list[str]:
 
     Filters duplicates and names that fail ``is_safe_property_name``.
     """
-    names: list[str] = []
-    seen: set[str] = set()
+    candidates: dict[str, None] = {}
     for raw_line in str(output or "").splitlines():
-        line = raw_line.rstrip()
-        match = re.match(r"^([^:\r\n]+):\s+", line)
-        if not match:
-            continue
-        name = match.group(1).strip()
-        if not name or name in seen:
-            continue
-        if not is_safe_property_name(name):
-            continue
-        seen.add(name)
-        names.append(name)
-    return names
+        match = _CLAUDE_LIST_NAME_PATTERN.match(raw_line.rstrip())
+        if match:
+            candidates[match.group(1).strip()] = None
+    return [name for name in candidates if is_safe_property_name(name)]
+
+
+_CLOUD_CONNECTOR_PREFIX_PATTERN = re.compile(r"^claude\.ai\s+", re.IGNORECASE)
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+_NON_SAFE_NAME_CHAR_PATTERN = re.compile(r"[^a-z0-9-]+")
 
 
 def _sanitize_cloud_connector_name(display_name: str) -> str:
@@ -522,19 +551,38 @@ def _sanitize_cloud_connector_name(display_name: str) -> str:
     "claude.ai Some Service" -> "some-service"
     """
     # Strip "claude.ai " prefix (case-insensitive)
-    cleaned = re.sub(r"^claude\.ai\s+", "", display_name.strip(), flags=re.IGNORECASE)
+    cleaned = _CLOUD_CONNECTOR_PREFIX_PATTERN.sub("", display_name.strip(), count=1)
     # Lowercase, replace spaces with hyphens, strip non-alphanumeric except hyphens
     cleaned = cleaned.lower().strip()
-    cleaned = re.sub(r"\s+", "-", cleaned)
-    cleaned = re.sub(r"[^a-z0-9-]", "", cleaned)
+    cleaned = _WHITESPACE_RUN_PATTERN.sub("-", cleaned)
+    cleaned = _NON_SAFE_NAME_CHAR_PATTERN.sub("", cleaned)
     # Remove leading/trailing hyphens
     cleaned = cleaned.strip("-")
     return cleaned
 
 
-_CLOUD_CONNECTOR_LINE_PATTERN = re.compile(
-    r"^(claude\.ai\s+[^:]+):\s+(https?://\S+)\s+-\s+", re.IGNORECASE
-)
+def _split_cloud_connector_line(line: str) -> tuple[str, str] | None:
+    """Split ``claude.ai <Name>: <url> - <status>`` into (display name, url).
+
+    Expects an rstripped line; returns None for anything else.  The
+    ``claude.ai`` prefix and URL scheme are matched case-insensitively.
+    """
+    if len(line) < 11 or line[:9].lower() != "claude.ai" or not line[9].isspace():
+        return None
+    colon = line.find(":")
+    # At least one non-colon character must follow the whitespace after "claude.ai".
+    if colon < 11 or not line[colon + 1 : colon + 2].isspace():
+        return None
+    parts = line[colon + 1 :].split(None, 1)
+    if len(parts) != 2:
+        return None
+    url, tail = parts
+    scheme = url[:8].lower()
+    if not ((scheme == "https://" and len(url) > 8) or (scheme[:7] == "http://" and len(url) > 7)):
+        return None
+    if tail[:1] != "-" or not tail[1:2].isspace():
+        return None
+    return line[:colon].strip(), url
 
 
 def parse_claude_mcp_list_cloud_connectors(output: str) -> list[dict]:
@@ -546,31 +594,62 @@ def parse_claude_mcp_list_cloud_connectors(output: str) -> list[dict]:
 
     Returns list of dicts with keys: display_name, safe_name, url, scope, transport.
     """
+    text = str(output or "")
     results: list[dict] = []
+    # Most list output has no cloud connectors at all; skip line splitting then.
+    if "claude.ai" not in text.lower():
+        return results
     seen: set[str] = set()
-    for raw_line in str(output or "").splitlines():
-        line = raw_line.rstrip()
-        match = _CLOUD_CONNECTOR_LINE_PATTERN.match(line)
-        if not match:
-            continue
-        display_name = match.group(1).strip()
-        url = match.group(2).strip()
-        safe_name = _sanitize_cloud_connector_name(display_name)
-        if not safe_name or safe_name in seen:
-            continue
-        if not is_safe_property_name(safe_name):
-            continue
-        seen.add(safe_name)
-        results.append({
-            "display_name": display_name,
-            "safe_name": safe_name,
-            "url": url,
-            "scope": "cloud",
-            "transport": "sse",
-        })
+    for raw_line in text.splitlines():
+        entry = _cloud_connector_entry(raw_line, seen)
+        if entry is not None:
+            results.append(entry)
     return results
 
 
+def _cloud_connector_entry(raw_line: str, seen: set[str]) -> dict | None:
+    """Build a cloud connector entry for one list line, skipping names in ``seen``."""
+    parsed = _split_cloud_connector_line(raw_line.rstrip())
+    if parsed is None:
+        return None
+    display_name, url = parsed
+    safe_name = _sanitize_cloud_connector_name(display_name)
+    if not safe_name or safe_name in seen:
+        return None
+    if not is_safe_property_name(safe_name):
+        return None
+    seen.add(safe_name)
+    return {
+        "display_name": display_name,
+        "safe_name": safe_name,
+        "url": url,
+        "scope": "cloud",
+        "transport": "sse",
+    }
+
+
+def _classify_claude_mcp_list_output(output: str) -> tuple[list[str], list[dict]]:
+    """Parse ``claude mcp list`` output into (server names, cloud connectors).
+
+    Equivalent to calling ``parse_claude_mcp_list_names`` and
+    ``parse_claude_mcp_list_cloud_connectors`` but scans the lines once.
+    """
+    text = str(output or "")
+    check_cloud = "claude.ai" in text.lower()
+    names: dict[str, None] = {}
+    cloud_connectors: list[dict] = []
+    seen_cloud: set[str] = set()
+    for raw_line in text.splitlines():
+        match = _CLAUDE_LIST_NAME_PATTERN.match(raw_line.rstrip())
+        if match:
+            names[match.group(1).strip()] = None
+        if check_cloud:
+            entry = _cloud_connector_entry(raw_line, seen_cloud)
+            if entry is not None:
+                cloud_connectors.append(entry)
+    return [name for name in names if is_safe_property_name(name)], cloud_connectors
+
+
 def parse_claude_mcp_get_details(output: str) -> dict:
     """Parse details from ``claude mcp get <name>`` output.
 
@@ -589,44 +668,25 @@ def parse_claude_mcp_get_details(output: str) -> dict:
     for raw_line in str(output or "").splitlines():
         line = raw_line.rstrip()
 
-        m = re.match(r"^\s{2}Scope:\s*(.+)$", line)
-        if m:
-            info["scope"] = m.group(1).strip()
-            in_headers = False
-            continue
-
-        m = re.match(r"^\s{2}Type:\s*(.+)$", line)
-        if m:
-            info["type"] = m.group(1).strip().lower()
-            in_headers = False
-            continue
-
-        m = re.match(r"^\s{2}URL:\s*(.+)$", line)
-        if m:
-            info["url"] = m.group(1).strip()
-            in_headers = False
-            continue
-
-        m = re.match(r"^\s{2}Command:\s*(.+)$", line)
+        m = _CLAUDE_GET_FIELD_PATTERN.match(line)
         if m:
-            info["command"] = m.group(1).strip()
-            in_headers = False
-            continue
-
-        m = re.match(r"^\s{2}Args:\s*(.*)$", line)
-        if m:
-            info["args"] = m.group(1).strip()
-            in_headers = False
-            continue
+            field, value = m.group(1), m.group(2).strip()
+            # Args may legitimately be empty; the other fields need a value.
+            if value or field == "Args":
+                if field == "Type":
+                    value = value.lower()
+                info[field.lower()] = value
+                in_headers = False
+                continue
 
-        if re.match(r"^\s{2}Headers:\s*$", line):
+        if _CLAUDE_GET_HEADERS_PATTERN.match(line):
             in_headers = True
             continue
 
         if not in_headers:
             continue
 
-        m = re.match(r"^\s{4}([^:]+):\s*(.*)$", line)
+        m = _CLAUDE_GET_HEADER_LINE_PATTERN.match(line)
         if m:
             info["headers"][m.group(1).strip()] = m.group(2).strip()
             continue
@@ -641,23 +701,25 @@ def parse_claude_mcp_get_details(output: str) -> dict:
 
 def is_claude_local_scope(scope_label: str) -> bool:
     """Return True if scope matches local/user/project."""
-    return bool(_CLAUDE_LOCAL_SCOPE_PATTERN.search(str(scope_label or "").strip()))
+    return _CLAUDE_LOCAL_SCOPE_PATTERN.search(str(scope_label or "")) is not None
 
 
 def is_claude_cloud_scope(scope_label: str) -> bool:
-    """Return True if scope is a cloud scope (positive match)."""
-    normalized = str(scope_label or "").strip()
-    if not normalized:
-        return False
-    if is_claude_local_scope(normalized):
-        return False
-    return bool(_CLAUDE_CLOUD_SCOPE_PATTERN.search(normalized))
+    """Return True if scope is a cloud scope (positive match).
+
+    Any local/user/project marker wins over a cloud mention.
+    """
+    found_cloud = False
+    for match in _CLAUDE_SCOPE_PATTERN.finditer(str(scope_label or "")):
+        if match.group(1):
+            return False
+        found_cloud = True
+    return found_cloud
 
 
 def _clean_env_for_claude() -> dict[str, str]:
     """Return a copy of os.environ without keys that block nested Claude CLI calls."""
-    blocked = {"CLAUDECODE", "CLAUDE_CODE"}
-    return {k: v for k, v in os.environ.items() if k not in blocked}
+    return {k: v for k, v in os.environ.items() if k not in _CLAUDE_BLOCKED_ENV_VARS}
 
 
 def _run_claude_mcp_command(args: list[str]) -> str:
@@ -714,8 +776,7 @@ def wrap_cloud(
 
     proxy_path = resolve_proxy()
     list_output = run_cmd(["list"])
-    names = parse_claude_mcp_list_names(list_output)
-    cloud_connectors = parse_claude_mcp_list_cloud_connectors(list_output)
+    names, cloud_connectors = _classify_claude_mcp_list_output(list_output)
 
     if not names and not cloud_connectors:
         if list_output.strip():
@@ -967,6 +1028,45 @@ def _decode_wrapped_entry(payload: str) -> dict | None:
     return None
 
 
+def _scan_proxy_args(args: list) -> tuple[int, str | None, bool]:
+    """Walk wrapped args once, stopping at the first ``--`` separator.
+
+    Returns ``(sep_idx, runtime, known_runtime)``: ``sep_idx`` is -1 when no
+    separator exists, ``runtime`` is the value following the first
+    ``--runtime`` flag, and ``known_runtime`` reports whether any ``--runtime``
+    flag is followed by "pip" or "npm".  Only args between index 1 and the
+    separator are treated as proxy flags.
+    """
+    runtime: str | None = None
+    known_runtime = False
+    expect_value = False
+    for idx, arg in enumerate(args):
+        if arg == "--":
+            return idx, runtime, known_runtime
+        if idx == 0:
+            continue
+        if expect_value:
+            if runtime is None:
+                runtime = arg
+            if arg in _WRAPPED_RUNTIMES:
+                known_runtime = True
+        expect_value = arg == "--runtime"
+    return -1, None, False
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_proxy_args_cached(args: tuple) -> tuple[int, str | None, bool]:
+    return _scan_proxy_args(args)
+
+
+def _summarize_proxy_args(args: list) -> tuple[int, str | None, bool]:
+    """Memoized ``_scan_proxy_args``; unhashable args fall back to a plain scan."""
+    try:
+        return _scan_proxy_args_cached(tuple(args))
+    except TypeError:
+        return _scan_proxy_args(args)
+
+
 def is_wrapped(entry: dict) -> bool:
     """Structural detection of a proxy-wrapped entry.
 
@@ -984,29 +1084,9 @@ def is_wrapped(entry: dict) -> bool:
     if args[0] != "proxy":
         return False
 
-    # Find "--" separator
-    try:
-        sep_idx = args.index("--")
-    except ValueError:
-        return False
-
-    # Condition 4: at least one arg after "--"
-    if sep_idx >= len(args) - 1:
-        return False
-
-    # Condition 2: "--runtime" followed by a value before "--"
-    proxy_args = args[1:sep_idx]
-    found_runtime = False
-    for j, arg in enumerate(proxy_args):
-        if arg == "--runtime" and j + 1 < len(proxy_args):
-            runtime_val = proxy_args[j + 1]
-            if runtime_val in ("pip", "npm"):
-                found_runtime = True
-                break
-    if not found_runtime:
-        return False
-
-    return True
+    sep_idx, _, known_runtime = _summarize_proxy_args(args)
+    # Conditions 2-4 in a single pass over the args
+    return known_runtime and 0 < sep_idx < len(args) - 1
 
 
 def get_runtime(entry: dict) -> str | None:
@@ -1014,16 +1094,7 @@ def get_runtime(entry: dict) -> str | None:
     args = entry.get("args", [])
     if not isinstance(args, list):
         return None
-    try:
-        sep_idx = args.index("--")
-    except ValueError:
-        return None
-
-    proxy_args = args[1:sep_idx]
-    for j, arg in enumerate(proxy_args):
-        if arg == "--runtime" and j + 1 < len(proxy_args):
-            return proxy_args[j + 1]
-    return None
+    return _summarize_proxy_args(args)[1]
 
 
 # ---------------------------------------------------------------------------
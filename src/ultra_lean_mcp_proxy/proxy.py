@@ -13,7 +13,7 @@ from typing import Any, Optional
 
 from .compress import compress_description, compress_schema
 from .config import ProxyConfig
-from .delta import create_delta, stable_hash
+from .delta import DELTA_ENCODING, create_delta, stable_hash
 from .result_compression import (
     CompressionOptions,
     TokenCounter,
@@ -388,6 +388,16 @@ def _minimal_tool(tool: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _clone_with_tools(result: dict[str, Any], tools: list[Any]) -> dict[str, Any]:
+    """Clone a tools/list result with its tools replaced, skipping the old tools subtree."""
+    if any(type(key) is not str for key in result):
+        out = clone_json(result)
+    else:
+        out = {key: value if key == "tools" else clone_json(value) for key, value in result.items()}
+    out["tools"] = tools
+    return out
+
+
 def _handle_tools_list_result(
     result: dict[str, Any],
     state: ProxyState,
@@ -417,9 +427,10 @@ def _handle_tools_list_result(
 
     visible_tools = processed_tools
     if config.lazy_loading_enabled:
-        tool_count = len(processed_tools)
-        tool_tokens = token_counter.count({"tools": processed_tools})
-        lazy_allowed = tool_count >= config.lazy_min_tools or tool_tokens >= config.lazy_min_tokens
+        # The token threshold is only consulted when the tool-count threshold is not met.
+        lazy_allowed = len(processed_tools) >= config.lazy_min_tools or token_counter.count_at_least(
+            {"tools": processed_tools}, config.lazy_min_tokens
+        )
     else:
         lazy_allowed = False
 
@@ -440,8 +451,7 @@ def _handle_tools_list_result(
         )
         visible_tools.append(_build_search_tool_definition(tool_names))
 
-    out = clone_json(result)
-    out["tools"] = visible_tools
+    out = _clone_with_tools(result, visible_tools)
     compressed_size = _json_size(out)
     saved = original_size - compressed_size
     if saved > 0:
@@ -466,8 +476,7 @@ def _handle_tools_list_result(
             metrics.tools_hash_sync_hits += 1
             force_refresh = (hit_count % config.tools_hash_sync_refresh_interval) == 0
             if not force_refresh:
-                not_modified = clone_json(out)
-                not_modified["tools"] = []
+                not_modified = _clone_with_tools(out, [])
                 ext = not_modified.setdefault("_ultra_lean_mcp_proxy", {})
                 if not isinstance(ext, dict):
                     ext = {}
@@ -478,7 +487,7 @@ def _handle_tools_list_result(
                 }
 
                 metrics.tools_hash_sync_not_modified += 1
-                byte_delta = max(0, _json_size(out) - _json_size(not_modified))
+                byte_delta = max(0, compressed_size - _json_size(not_modified))
                 if byte_delta > 0:
                     metrics.tools_hash_sync_saved_bytes += byte_delta
                 token_delta = max(0, token_counter.count(out) - token_counter.count(not_modified))
@@ -719,7 +728,8 @@ def _apply_delta_response(
     delta_counters: dict[str, int],
     token_counter: TokenCounter,
 ) -> Any:
-    previous = state.history_get(history_key)
+    # previous is only compared and diffed, never mutated or returned.
+    previous = state.history_get(history_key, clone=False)
     state.history_set(history_key, result)
 
     if not config.delta_responses_enabled:
@@ -741,7 +751,7 @@ def _apply_delta_response(
 
     if previous == result:
         delta = {
-            "encoding": "lapc-delta-v1",
+            "encoding": DELTA_ENCODING,
             "unchanged": True,
             "currentHash": stable_hash(result),
         }
@@ -1085,7 +1095,7 @@ async def run_proxy(command: list[str], config: Optional[ProxyConfig] = None, st
                                 ttl = base_ttl
                                 if cfg.cache_adaptive_ttl and base_ttl > 0:
                                     raw_key = f"cache_raw:{cache_key}"
-                                    previous_raw = state.history_get(raw_key)
+                                    previous_raw = state.history_get(raw_key, clone=False)
                                     if previous_raw is not None:
                                         changed = previous_raw != raw_upstream_result
                                         if changed:
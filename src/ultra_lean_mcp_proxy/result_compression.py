@@ -7,6 +7,8 @@ import json
 from dataclasses import dataclass
 from typing import Any, MutableMapping
 
+from .state import STABLE_JSON_ENCODER
+
 
 @dataclass
 class CompressionOptions:
@@ -19,12 +21,16 @@ class CompressionOptions:
     columnar_min_fields: int = 2
 
 
+# Unsorted counterpart of STABLE_JSON_ENCODER, for size and token estimates.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
 def _json_size(value: Any) -> int:
-    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+    return len(_COMPACT_ENCODER.encode(value))
 
 
 def _stable_json(value: Any) -> str:
-    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+    return STABLE_JSON_ENCODER.encode(value)
 
 
 class TokenCounter:
@@ -56,7 +62,17 @@ class TokenCounter:
                 self._enc = None
 
     def count(self, value: Any) -> int:
-        text = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        return self._count_text(_COMPACT_ENCODER.encode(value))
+
+    def count_at_least(self, value: Any, threshold: int) -> bool:
+        """Return ``count(value) >= threshold``, skipping the tokenizer when it cannot matter."""
+        text = _COMPACT_ENCODER.encode(value)
+        # Each BPE token covers at least one UTF-8 byte.
+        if self._enc is not None and len(text.encode("utf-8")) < threshold:
+            return False
+        return self._count_text(text) >= threshold
+
+    def _count_text(self, text: str) -> int:
         if self._enc is not None:
             return len(self._enc.encode(text))
         # Deterministic fallback approximation.
@@ -293,6 +309,11 @@ def estimate_compressibility(value: Any) -> float:
     and homogeneous list-of-object shapes.
     """
     key_counter: dict[str, int] = {}
+    # Duplicate scalars are those with equal JSON text. Strings and ints encode
+    # injectively within their own type, so they are counted by value and only
+    # the remaining scalars pay for json.dumps.
+    str_counter: dict[str, int] = {}
+    int_counter: dict[int, int] = {}
     scalar_counter: dict[str, int] = {}
     homogeneous_lists = 0
     total_lists = 0
@@ -312,10 +333,15 @@ def estimate_compressibility(value: Any) -> float:
                     homogeneous_lists += 1
             for child in node:
                 walk(child)
-        else:
-            if isinstance(node, (str, int, float, bool)) or node is None:
-                marker = json.dumps(node, ensure_ascii=False)
-                scalar_counter[marker] = scalar_counter.get(marker, 0) + 1
+        elif isinstance(node, str):
+            text = node if type(node) is str else str.__str__(node)
+            str_counter[text] = str_counter.get(text, 0) + 1
+        elif isinstance(node, int) and not isinstance(node, bool):
+            number = node if type(node) is int else int(node)
+            int_counter[number] = int_counter.get(number, 0) + 1
+        elif isinstance(node, (float, bool)) or node is None:
+            marker = json.dumps(node, ensure_ascii=False)
+            scalar_counter[marker] = scalar_counter.get(marker, 0) + 1
 
     walk(value)
 
@@ -323,8 +349,11 @@ def estimate_compressibility(value: Any) -> float:
     duplicate_keys = max(0, total_keys - len(key_counter))
     key_repeat_ratio = (duplicate_keys / total_keys) if total_keys else 0.0
 
-    total_scalars = sum(scalar_counter.values())
-    duplicate_scalars = max(0, total_scalars - len(scalar_counter))
+    total_scalars = (
+        sum(str_counter.values()) + sum(int_counter.values()) + sum(scalar_counter.values())
+    )
+    distinct_scalars = len(str_counter) + len(int_counter) + len(scalar_counter)
+    duplicate_scalars = max(0, total_scalars - distinct_scalars)
     scalar_repeat_ratio = (duplicate_scalars / total_scalars) if total_scalars else 0.0
 
     homogeneous_ratio = (homogeneous_lists / total_lists) if total_lists else 0.0
@@ -3,21 +3,89 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Optional
 
 
+JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Sorted compact encoder shared by hashing and canonicalization helpers. Built
+# once; json.dumps would construct a fresh encoder for these options per call.
+STABLE_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+_SEARCH_TERM_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+# Cache keys only need to be unique within one process, so a 128-bit digest is plenty.
+_CACHE_KEY_DIGEST_SIZE = 16
+
+
+class _NotPlainJson(Exception):
+    """Raised by the fast clone path for values only a JSON round-trip handles."""
+
+
 def clone_json(value: Any) -> Any:
-    """Clone JSON-serializable data via round-trip."""
-    return json.loads(json.dumps(value))
+    """Clone JSON-serializable data, as a json.loads(json.dumps(value)) round-trip would.
+
+    Plain dict/list/scalar trees are rebuilt directly with an explicit stack.
+    Anything the round-trip would coerce or reject (tuples, non-str keys,
+    other types, shared or cyclic containers) falls back to the round-trip.
+    """
+    value_type = type(value)
+    if value_type in JSON_SCALAR_TYPES:
+        return value
+    try:
+        return _clone_plain_json(value)
+    except _NotPlainJson:
+        return json.loads(json.dumps(value))
+
+
+def _clone_plain_json(value: Any) -> Any:
+    if type(value) is dict:
+        root: Any = {}
+    elif type(value) is list:
+        root = []
+    else:
+        raise _NotPlainJson
+    seen = {id(value)}
+    stack = [(value, root)]
+    while stack:
+        source, target = stack.pop()
+        if type(source) is dict:
+            for key, item in source.items():
+                if type(key) is not str:
+                    raise _NotPlainJson
+                item_type = type(item)
+                if item_type in JSON_SCALAR_TYPES:
+                    target[key] = item
+                    continue
+                if item_type is not dict and item_type is not list or id(item) in seen:
+                    raise _NotPlainJson
+                seen.add(id(item))
+                target[key] = child = {} if item_type is dict else []
+                stack.append((item, child))
+        else:
+            for item in source:
+                item_type = type(item)
+                if item_type in JSON_SCALAR_TYPES:
+                    target.append(item)
+                    continue
+                if item_type is not dict and item_type is not list or id(item) in seen:
+                    raise _NotPlainJson
+                seen.add(id(item))
+                child = {} if item_type is dict else []
+                target.append(child)
+                stack.append((item, child))
+    return root
 
 
 def stable_json_dumps(value: Any) -> str:
     """Deterministic JSON serialization used for hashing."""
-    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return STABLE_JSON_ENCODER.encode(value)
 
 
 def stable_hash(value: Any) -> str:
@@ -31,50 +99,67 @@ def args_hash(arguments: Any) -> str:
     return stable_hash(arguments)
 
 
+_MUTATING_VERBS = (
+    "create",
+    "update",
+    "delete",
+    "remove",
+    "set",
+    "write",
+    "insert",
+    "patch",
+    "post",
+    "put",
+    "merge",
+    "upload",
+    "commit",
+    # Stateful browser/session-like operations that can invalidate read cache.
+    "navigate",
+    "open",
+    "close",
+    "click",
+    "type",
+    "press",
+    "select",
+    "hover",
+    "drag",
+    "drop",
+    "scroll",
+    "evaluate",
+    "execute",
+    "goto",
+    "reload",
+    "back",
+    "forward",
+)
+# Verbs match anywhere in the lowercased name (e.g. "puppeteer_navigate").
+_MUTATING_VERB_RE = re.compile("|".join(map(re.escape, _MUTATING_VERBS)))
+
+
 def is_mutating_tool_name(tool_name: str) -> bool:
-    verbs = [
-        "create",
-        "update",
-        "delete",
-        "remove",
-        "set",
-        "write",
-        "insert",
-        "patch",
-        "post",
-        "put",
-        "merge",
-        "upload",
-        "commit",
-        # Stateful browser/session-like operations that can invalidate read cache.
-        "navigate",
-        "open",
-        "close",
-        "click",
-        "type",
-        "press",
-        "select",
-        "hover",
-        "drag",
-        "drop",
-        "scroll",
-        "evaluate",
-        "execute",
-        "goto",
-        "reload",
-        "back",
-        "forward",
-    ]
-    name = tool_name.lower()
-    return any(v in name for v in verbs)
+    return _MUTATING_VERB_RE.search(tool_name.lower()) is not None
+
+
+def _tool_search_fields(tool: dict[str, Any]) -> tuple[dict[str, Any], str, str, str, str]:
+    """Return (tool, name, description, parameter names, all three) lowercased for search."""
+    name = str(tool.get("name", ""))
+    desc = str(tool.get("description", ""))
+    schema = tool.get("inputSchema") or tool.get("input_schema") or {}
+    props = schema.get("properties", {}) if isinstance(schema, dict) else {}
+    param_text = " ".join(str(k) for k in props.keys())
+    haystack = f"{name} {desc} {param_text}".lower()
+    return tool, name.lower(), desc.lower(), param_text.lower(), haystack
 
 
 def make_cache_key(session_id: str, server_name: str, tool_name: str, arguments: Any) -> str:
-    return f"{session_id}:{server_name}:{tool_name}:{args_hash(arguments)}"
+    text = stable_json_dumps({} if arguments is None else arguments)
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=_CACHE_KEY_DIGEST_SIZE).hexdigest()
+    return f"{session_id}:{server_name}:{tool_name}:{digest}"
 
 
 @dataclass
 class CacheEntry:
+    # Timestamps are time.monotonic() seconds, so wall-clock jumps cannot expire entries.
     value: Any
     expires_at: float
     created_at: float
@@ -93,9 +178,12 @@ class ProxyState:
 
     def __init__(self, max_cache_entries: int = 5000):
         self.max_cache_entries = max(1, max_cache_entries)
-        self._cache: dict[str, CacheEntry] = {}
+        # Least recently used first; hits and sets move a key to the end.
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._history: dict[str, Any] = {}
         self._tools: list[dict[str, Any]] = []
+        # Lowercased search fields per tool; built on first search after set_tools.
+        self._search_index: Optional[list[tuple[dict[str, Any], str, str, str, str]]] = None
         self._tools_hash: dict[str, ToolsHashEntry] = {}
 
     # Cache
@@ -103,21 +191,22 @@ class ProxyState:
         entry = self._cache.get(key)
         if not entry:
             return None
-        now = time.time()
-        if entry.expires_at < now:
+        if entry.expires_at < time.monotonic():
             del self._cache[key]
             return None
         entry.hits += 1
+        self._cache.move_to_end(key)
         return clone_json(entry.value)
 
     def cache_set(self, key: str, value: Any, ttl_seconds: int):
-        now = time.time()
+        now = time.monotonic()
         self._cache[key] = CacheEntry(
             value=clone_json(value),
             created_at=now,
             expires_at=now + max(0, ttl_seconds),
             hits=0,
         )
+        self._cache.move_to_end(key)
         self._evict_cache_if_needed()
 
     def cache_invalidate_prefix(self, prefix: str) -> int:
@@ -129,22 +218,16 @@ class ProxyState:
         return removed
 
     def _evict_cache_if_needed(self):
-        if len(self._cache) <= self.max_cache_entries:
-            return
-        # Evict lowest-hit then oldest.
-        ordered = sorted(
-            self._cache.items(),
-            key=lambda item: (item[1].hits, item[1].created_at),
-        )
-        overflow = len(self._cache) - self.max_cache_entries
-        for key, _ in ordered[:overflow]:
-            self._cache.pop(key, None)
+        # Evict least recently used.
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
 
     # Delta history
-    def history_get(self, key: str) -> Optional[Any]:
+    def history_get(self, key: str, *, clone: bool = True) -> Optional[Any]:
+        """Return the stored value; ``clone=False`` is for callers that only read it."""
         value = self._history.get(key)
-        if value is None:
-            return None
+        if value is None or not clone:
+            return value
         return clone_json(value)
 
     def history_set(self, key: str, value: Any):
@@ -165,6 +248,7 @@ class ProxyState:
     # Tools index
     def set_tools(self, tools: list[dict[str, Any]]):
         self._tools = clone_json(tools or [])
+        self._search_index = None
 
     def get_tools(self) -> list[dict[str, Any]]:
         return clone_json(self._tools)
@@ -178,25 +262,22 @@ class ProxyState:
         if not self._tools:
             return []
 
-        terms = [t for t in re.findall(r"[a-zA-Z0-9_]+", query.lower()) if t]
-        ranked = []
-        for tool in self._tools:
-            name = str(tool.get("name", ""))
-            desc = str(tool.get("description", ""))
-            schema = tool.get("inputSchema") or tool.get("input_schema") or {}
-            props = schema.get("properties", {}) if isinstance(schema, dict) else {}
-            param_text = " ".join(str(k) for k in props.keys())
-            haystack = f"{name} {desc} {param_text}".lower()
+        if self._search_index is None:
+            self._search_index = [_tool_search_fields(tool) for tool in self._tools]
 
+        query_lower = query.lower()
+        terms = _SEARCH_TERM_RE.findall(query_lower)
+        ranked = []
+        for tool, name, desc, param_text, haystack in self._search_index:
             score = 0.0
-            if query.lower() in name.lower():
+            if query_lower in name:
                 score += 4.0
             for term in terms:
-                if term in name.lower():
+                if term in name:
                     score += 2.0
-                if term in desc.lower():
+                if term in desc:
                     score += 1.0
-                if term in param_text.lower():
+                if term in param_text:
                     score += 1.25
                 if term in haystack:
                     score += 0.2
@@ -207,9 +288,8 @@ class ProxyState:
         if not ranked:
             ranked = [(0.01, tool) for tool in self._tools]
 
-        ranked.sort(key=lambda item: item[0], reverse=True)
         results = []
-        for score, tool in ranked[: max(1, top_k)]:
+        for score, tool in heapq.nlargest(max(1, top_k), ranked, key=lambda item: item[0]):
             item = {
                 "name": tool.get("name"),
                 "score": round(score, 3),
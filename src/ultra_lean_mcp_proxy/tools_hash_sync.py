@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
 import re
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from .delta import canonicalize
+from .state import STABLE_JSON_ENCODER
+
+# All digests are 32 bytes so wire values keep the `<algorithm>:<64 hex>` shape.
+# Each factory accepts optional initial data, like the hashlib constructors.
+TOOLS_HASH_ALGORITHMS: dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": functools.partial(hashlib.blake2b, digest_size=32),
+    "blake2s": hashlib.blake2s,
+}
 
 TOOLS_HASH_WIRE_RE = re.compile(r"^([a-z0-9_]+):([0-9a-f]{64})$")
 
+# Translation tables that delete the characters allowed in each TOOLS_HASH_WIRE_RE
+# group, so a part is valid when nothing is left after str.translate().
+_DROP_WIRE_ALGORITHM_CHARS = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789_")
+_DROP_WIRE_HEX_CHARS = str.maketrans("", "", "0123456789abcdef")
+
 
 def canonical_tools_json(tools_payload: Any) -> str:
     """Return canonical JSON text for a visible tools payload."""
-    return json.dumps(canonicalize(tools_payload), separators=(",", ":"), ensure_ascii=False)
+    return STABLE_JSON_ENCODER.encode(tools_payload)
+
+
+@functools.lru_cache(maxsize=32)
+def _fingerprint_envelope_suffix(server_fingerprint: str) -> bytes:
+    """Return the envelope bytes that follow the tools payload; a process sees few fingerprints."""
+    fingerprint = STABLE_JSON_ENCODER.encode(server_fingerprint)
+    return f',"server_fingerprint":{fingerprint}}}'.encode("utf-8")
 
 
 def compute_tools_hash(
@@ -25,19 +45,20 @@ def compute_tools_hash(
     server_fingerprint: Optional[str] = None,
 ) -> str:
     """Compute wire-format hash for a visible tools payload."""
-    if algorithm != "sha256":
+    factory = TOOLS_HASH_ALGORITHMS.get(algorithm)
+    if factory is None:
         raise ValueError(f"Unsupported tools hash algorithm: {algorithm}")
 
-    payload = canonicalize(tools_payload)
-    preimage: Any = payload
+    tools_bytes = canonical_tools_json(tools_payload).encode("utf-8")
     if include_server_fingerprint:
-        preimage = {
-            "tools": payload,
-            "server_fingerprint": server_fingerprint or "",
-        }
-    text = json.dumps(preimage, separators=(",", ":"), ensure_ascii=False)
-    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
-    return f"sha256:{digest}"
+        # The envelope keeps "tools" before "server_fingerprint" (not sorted).
+        # Streaming it avoids copying tools_bytes into a concatenated buffer.
+        hasher = factory(b'{"tools":')
+        hasher.update(tools_bytes)
+        hasher.update(_fingerprint_envelope_suffix(server_fingerprint or ""))
+    else:
+        hasher = factory(tools_bytes)
+    return f"{algorithm}:{hasher.hexdigest()}"
 
 
 def parse_if_none_match(value: Any, *, expected_algorithm: str = "sha256") -> Optional[str]:
@@ -48,10 +69,14 @@ def parse_if_none_match(value: Any, *, expected_algorithm: str = "sha256") -> Op
     if not isinstance(value, str):
         return None
     candidate = value.strip().lower()
-    match = TOOLS_HASH_WIRE_RE.match(candidate)
-    if not match:
-        return None
-    if match.group(1) != expected_algorithm:
+    algorithm, _, digest = candidate.partition(":")
+    if (
+        algorithm != expected_algorithm
+        or len(digest) != 64
+        or not algorithm
+        or digest.translate(_DROP_WIRE_HEX_CHARS)
+        or algorithm.translate(_DROP_WIRE_ALGORITHM_CHARS)
+    ):
         return None
     return candidate
 
@@ -6,16 +6,21 @@ files are never touched.  Every test uses ``tmp_path`` for isolation.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import platform
 import time
 from pathlib import Path
 from urllib.error import HTTPError
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from ultra_lean_mcp_proxy.installer import (
     strip_jsonc_comments,
     read_config,
@@ -39,6 +44,7 @@ from ultra_lean_mcp_proxy.installer import (
     is_claude_local_scope,
     is_claude_cloud_scope,
     wrap_cloud,
+    _classify_claude_mcp_list_output,
     _clean_env_for_claude,
 )
 
@@ -54,7 +60,7 @@ def _make_config(tmp_path: Path, name: str, servers: dict) -> str:
     path = tmp_path / name / "config.json"
     path.parent.mkdir(parents=True, exist_ok=True)
     data = {"mcpServers": servers}
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    path.write_bytes(json.dumps(data, separators=(",", ":")).encode("utf-8"))
     return str(path)
 
 
@@ -67,10 +73,61 @@ def _mock_locations(tmp_path: Path, configs: dict[str, dict]) -> list[dict]:
     return locations
 
 
+@pytest.fixture(scope="session")
+def prebuilt_configs() -> dict[str, bytes]:
+    """Serialized client configs shared by tests that seed identical files."""
+    return {
+        "github_npx": json.dumps(
+            {"mcpServers": {"github": {"command": "npx", "args": ["server-github"]}}},
+            separators=(",", ":"),
+        ).encode("utf-8"),
+    }
+
+
+def _mock_prebuilt_locations(tmp_path: Path, name: str, payload: bytes) -> list[dict]:
+    """Like ``_mock_locations`` for a single client seeded from prebuilt bytes."""
+    path = tmp_path / name / "config.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return [{"name": name, "path": str(path), "key": "mcpServers"}]
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Rewrite a config file with 2-space indentation, as the installer does."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _digest(path: str) -> bytes:
+    """Return a short content digest of a file, for detecting any rewrite."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).digest()
+
+
+def _marker_positions(args: list) -> dict[str, int]:
+    """Locate the ``--runtime`` flag and ``--`` separator in one pass.
+
+    Only the first occurrence of each marker is recorded.
+    """
+    positions: dict[str, int] = {}
+    for idx, arg in enumerate(args):
+        if arg in ("--runtime", "--") and arg not in positions:
+            positions[arg] = idx
+            if len(positions) == 2:
+                break
+    return positions
+
+
+def _read_json(path: str) -> dict:
+    """Parse a config file straight from its bytes."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _read_servers(path: str) -> dict:
     """Read the mcpServers dict back from a config file."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)["mcpServers"]
+    return _read_json(path)["mcpServers"]
 
 
 def _patch_installer(monkeypatch, locations):
@@ -82,6 +139,18 @@ def _patch_installer(monkeypatch, locations):
     monkeypatch.setattr(inst, "_load_local_overrides", lambda: [])
     monkeypatch.setattr(inst, "resolve_proxy_path", lambda: FAKE_PROXY)
     monkeypatch.setattr(inst, "is_url_bridge_available", lambda: True)
+    inst.read_config.cache_clear()
+
+
+def _patch_claude_user_location(monkeypatch, config_path: str) -> None:
+    """Point ``get_config_locations`` at a single claude-code-user config.
+
+    The location list is built once; each call hands out a shallow copy.
+    """
+    import ultra_lean_mcp_proxy.installer as inst
+
+    frozen = ({"name": "claude-code-user", "path": config_path, "key": "mcpServers"},)
+    monkeypatch.setattr(inst, "get_config_locations", lambda offline=True, _locs=frozen: list(_locs))
 
 
 # ---------------------------------------------------------------------------
@@ -89,35 +158,38 @@ def _patch_installer(monkeypatch, locations):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def original():
+    return {
+        "command": "npx",
+        "args": ["@modelcontextprotocol/server-filesystem", "/tmp"],
+    }
+
+
+@pytest.fixture(scope="class")
+def wrapped(original):
+    return wrap_entry(original, FAKE_PROXY, runtime="pip")
+
+
 class TestWrapUnwrapBasic:
     """Wrap an entry, verify structure, unwrap, verify matches original."""
 
-    def test_wrap_produces_correct_structure(self):
-        original = {
-            "command": "npx",
-            "args": ["@modelcontextprotocol/server-filesystem", "/tmp"],
-        }
-        wrapped = wrap_entry(original, FAKE_PROXY, runtime="pip")
-
+    def test_wrap_produces_correct_structure(self, wrapped):
         assert wrapped["command"] == FAKE_PROXY
         args = wrapped["args"]
         assert args[0] == "proxy"
-        assert "--runtime" in args
-        rt_idx = args.index("--runtime")
+        markers = _marker_positions(args)
+        assert "--runtime" in markers
+        rt_idx = markers["--runtime"]
         assert args[rt_idx + 1] == "pip"
-        assert "--" in args
-        sep_idx = args.index("--")
+        assert "--" in markers
+        sep_idx = markers["--"]
         # Original command + args appear after the separator
         assert args[sep_idx + 1] == "npx"
         assert args[sep_idx + 2] == "@modelcontextprotocol/server-filesystem"
         assert args[sep_idx + 3] == "/tmp"
 
-    def test_unwrap_restores_original(self):
-        original = {
-            "command": "npx",
-            "args": ["@modelcontextprotocol/server-filesystem", "/tmp"],
-        }
-        wrapped = wrap_entry(original, FAKE_PROXY, runtime="pip")
+    def test_unwrap_restores_original(self, original, wrapped):
         restored = unwrap_entry(wrapped)
 
         assert restored["command"] == original["command"]
@@ -174,19 +246,12 @@ class TestWrapUnwrapBasic:
 class TestWrapIdempotent:
     """Wrapping an already-wrapped entry should be a no-op."""
 
-    def test_double_wrap_is_noop(self):
-        original = {
-            "command": "npx",
-            "args": ["server-github"],
-        }
-        wrapped_once = wrap_entry(original, FAKE_PROXY, runtime="pip")
-        wrapped_twice = wrap_entry(wrapped_once, FAKE_PROXY, runtime="pip")
+    def test_double_wrap_is_noop(self, wrapped):
+        wrapped_twice = wrap_entry(wrapped, FAKE_PROXY, runtime="pip")
 
-        assert wrapped_once == wrapped_twice
+        assert wrapped == wrapped_twice
 
-    def test_double_wrap_different_runtime_is_noop(self):
-        original = {"command": "npx", "args": ["server"]}
-        wrapped = wrap_entry(original, FAKE_PROXY, runtime="pip")
+    def test_double_wrap_different_runtime_is_noop(self, wrapped):
         # Attempting to re-wrap with different runtime should still be a no-op
         # because the entry is already wrapped.
         wrapped_again = wrap_entry(wrapped, FAKE_PROXY, runtime="npm")
@@ -339,35 +404,27 @@ class TestBackupCreation:
 class TestDryRunNoModify:
     """Install with dry_run=True should not alter any config files."""
 
-    def test_install_dry_run_preserves_files(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {"command": "npx", "args": ["server-github"]},
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
+    def test_install_dry_run_preserves_files(self, tmp_path, monkeypatch, prebuilt_configs):
+        locations = _mock_prebuilt_locations(tmp_path, "claude-desktop", prebuilt_configs["github_npx"])
         _patch_installer(monkeypatch, locations)
 
-        original_text = Path(locations[0]["path"]).read_text(encoding="utf-8")
+        digest_before = _digest(locations[0]["path"])
 
         install(dry_run=True, runtime="pip")
 
-        after_text = Path(locations[0]["path"]).read_text(encoding="utf-8")
-        assert original_text == after_text
+        assert _digest(locations[0]["path"]) == digest_before
 
-    def test_uninstall_dry_run_preserves_files(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {"command": "npx", "args": ["server-github"]},
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
+    def test_uninstall_dry_run_preserves_files(self, tmp_path, monkeypatch, prebuilt_configs):
+        locations = _mock_prebuilt_locations(tmp_path, "claude-desktop", prebuilt_configs["github_npx"])
         _patch_installer(monkeypatch, locations)
 
         # First do a real install
         install(dry_run=False, runtime="pip")
-        wrapped_text = Path(locations[0]["path"]).read_text(encoding="utf-8")
+        digest_wrapped = _digest(locations[0]["path"])
 
         # Then dry-run uninstall
         uninstall(dry_run=True)
-        after_text = Path(locations[0]["path"]).read_text(encoding="utf-8")
-        assert wrapped_text == after_text
+        assert _digest(locations[0]["path"]) == digest_wrapped
 
 
 # ---------------------------------------------------------------------------
@@ -389,7 +446,7 @@ class TestInstallUninstallRoundtrip:
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
-        original_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        original_data = _read_json(config_path)
 
         # Install
         install(dry_run=False, runtime="pip")
@@ -398,7 +455,7 @@ class TestInstallUninstallRoundtrip:
 
         # Uninstall
         uninstall(dry_run=False)
-        restored_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        restored_data = _read_json(config_path)
         assert restored_data == original_data
 
     def test_roundtrip_multiple_servers(self, tmp_path, monkeypatch):
@@ -411,7 +468,7 @@ class TestInstallUninstallRoundtrip:
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
-        original_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        original_data = _read_json(config_path)
 
         install(dry_run=False, runtime="pip")
 
@@ -419,7 +476,7 @@ class TestInstallUninstallRoundtrip:
             assert is_wrapped(_read_servers(config_path)[name])
 
         uninstall(dry_run=False)
-        restored_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        restored_data = _read_json(config_path)
         assert restored_data == original_data
 
     def test_roundtrip_across_multiple_clients(self, tmp_path, monkeypatch):
@@ -432,15 +489,13 @@ class TestInstallUninstallRoundtrip:
 
         originals = {}
         for loc in locations:
-            originals[loc["name"]] = json.loads(
-                Path(loc["path"]).read_text(encoding="utf-8")
-            )
+            originals[loc["name"]] = _read_json(loc["path"])
 
         install(dry_run=False, runtime="pip")
         uninstall(dry_run=False)
 
         for loc in locations:
-            restored = json.loads(Path(loc["path"]).read_text(encoding="utf-8"))
+            restored = _read_json(loc["path"])
             assert restored == originals[loc["name"]]
 
     def test_roundtrip_url_server_restores_original_entry(self, tmp_path, monkeypatch):
@@ -454,7 +509,7 @@ class TestInstallUninstallRoundtrip:
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
-        original_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        original_data = _read_json(config_path)
         install(dry_run=False, runtime="pip")
 
         wrapped_servers = _read_servers(config_path)
@@ -462,7 +517,7 @@ class TestInstallUninstallRoundtrip:
         assert get_wrapped_transport(wrapped_servers["remote"]) == "url"
 
         uninstall(dry_run=False)
-        restored_data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        restored_data = _read_json(config_path)
         assert restored_data == original_data
 
 
@@ -474,28 +529,7 @@ class TestInstallUninstallRoundtrip:
 class TestPreservesExtraKeys:
     """Config with ``env`` and custom keys should survive wrap/unwrap."""
 
-    def test_env_preserved_through_roundtrip(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {
-                "command": "npx",
-                "args": ["server-github"],
-                "env": {"GITHUB_TOKEN": "ghp_abc123"},
-            },
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
-        _patch_installer(monkeypatch, locations)
-        config_path = locations[0]["path"]
-
-        install(dry_run=False, runtime="pip")
-        wrapped = _read_servers(config_path)["github"]
-        # env should still be present on the wrapped entry
-        assert wrapped.get("env") == {"GITHUB_TOKEN": "ghp_abc123"}
-
-        uninstall(dry_run=False)
-        restored = _read_servers(config_path)["github"]
-        assert restored["env"] == {"GITHUB_TOKEN": "ghp_abc123"}
-
-    def test_custom_keys_preserved(self, tmp_path, monkeypatch):
+    def test_env_and_custom_keys_preserved_through_roundtrip(self, tmp_path, monkeypatch):
         servers = {
             "myserver": {
                 "command": "python",
@@ -510,8 +544,13 @@ class TestPreservesExtraKeys:
         config_path = locations[0]["path"]
 
         install(dry_run=False, runtime="pip")
-        uninstall(dry_run=False)
+        wrapped = _read_servers(config_path)["myserver"]
+        # env and custom keys should still be present on the wrapped entry
+        assert wrapped.get("env") == {"API_KEY": "secret"}
+        assert wrapped.get("customField") == "keep-me"
+        assert wrapped.get("timeout") == 30
 
+        uninstall(dry_run=False)
         restored = _read_servers(config_path)["myserver"]
         assert restored["customField"] == "keep-me"
         assert restored["timeout"] == 30
@@ -570,6 +609,8 @@ class TestWindowsCmdResolution:
     """On Windows, ``.cmd`` extension should be tried for proxy resolution."""
 
     def test_cmd_extension_tried_on_windows(self, tmp_path, monkeypatch):
+        import platform
+
         import ultra_lean_mcp_proxy.installer as inst
 
         # Create a fake .cmd file
@@ -596,24 +637,21 @@ class TestUninstallAfterManualEdit:
     """If user adds extra args to a wrapped entry, unwrap should still work
     as long as structural detection passes."""
 
-    def test_unwrap_with_user_added_stats_flag(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {"command": "npx", "args": ["server-github"]},
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
+    def test_unwrap_with_user_added_stats_flag(self, tmp_path, monkeypatch, prebuilt_configs):
+        locations = _mock_prebuilt_locations(tmp_path, "claude-desktop", prebuilt_configs["github_npx"])
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
         install(dry_run=False, runtime="pip")
 
         # Simulate user manually adding --stats to the wrapped entry
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         entry = data["mcpServers"]["github"]
         args = entry["args"]
-        sep_idx = args.index("--")
+        sep_idx = _marker_positions(args)["--"]
         # Insert --stats before the separator
         args.insert(sep_idx, "--stats")
-        Path(config_path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_json(config_path, data)
 
         # The entry should still be detected as wrapped
         modified_entry = _read_servers(config_path)["github"]
@@ -635,11 +673,8 @@ class TestRuntimeMarkerFiltering:
     """Wrap with runtime='npm', attempt uninstall with default runtime='pip',
     verify entry stays wrapped."""
 
-    def test_pip_uninstall_skips_npm_entries(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {"command": "npx", "args": ["server-github"]},
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
+    def test_pip_uninstall_skips_npm_entries(self, tmp_path, monkeypatch, prebuilt_configs):
+        locations = _mock_prebuilt_locations(tmp_path, "claude-desktop", prebuilt_configs["github_npx"])
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
@@ -655,11 +690,8 @@ class TestRuntimeMarkerFiltering:
         assert is_wrapped(still_wrapped)
         assert get_runtime(still_wrapped) == "npm"
 
-    def test_npm_uninstall_unwraps_npm_entries(self, tmp_path, monkeypatch):
-        servers = {
-            "github": {"command": "npx", "args": ["server-github"]},
-        }
-        locations = _mock_locations(tmp_path, {"claude-desktop": servers})
+    def test_npm_uninstall_unwraps_npm_entries(self, tmp_path, monkeypatch, prebuilt_configs):
+        locations = _mock_prebuilt_locations(tmp_path, "claude-desktop", prebuilt_configs["github_npx"])
         _patch_installer(monkeypatch, locations)
         config_path = locations[0]["path"]
 
@@ -686,11 +718,11 @@ class TestRuntimeMarkerFiltering:
         install(dry_run=False, runtime="pip")
 
         # Manually change github to npm runtime for test scenario
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         gh_args = data["mcpServers"]["github"]["args"]
-        rt_idx = gh_args.index("--runtime")
+        rt_idx = _marker_positions(gh_args)["--runtime"]
         gh_args[rt_idx + 1] = "npm"
-        Path(config_path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_json(config_path, data)
 
         # Verify mixed runtimes
         mixed = _read_servers(config_path)
@@ -749,17 +781,17 @@ class TestMixedRuntimeStatus:
         install(dry_run=False, runtime="pip")
 
         # Manually change github's runtime to npm
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         gh_args = data["mcpServers"]["github"]["args"]
-        rt_idx = gh_args.index("--runtime")
+        rt_idx = _marker_positions(gh_args)["--runtime"]
         gh_args[rt_idx + 1] = "npm"
-        Path(config_path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_json(config_path, data)
 
         # Manually unwrap 'unwrapped' to simulate a non-wrapped entry
         entry = data["mcpServers"]["unwrapped"]
         restored_unwrapped = unwrap_entry(entry)
         data["mcpServers"]["unwrapped"] = restored_unwrapped
-        Path(config_path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_json(config_path, data)
 
         result = status()
 
@@ -791,78 +823,35 @@ class TestMixedRuntimeStatus:
 class TestIsWrappedStructuralDetection:
     """Test various edge cases for structural detection."""
 
-    def test_fully_valid_wrapped_entry(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--runtime", "pip", "--", "npx", "server"],
-        }
-        assert is_wrapped(entry) is True
-
-    def test_wrapped_with_extra_flags(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--stats", "--runtime", "pip", "--", "npx"],
-        }
-        assert is_wrapped(entry) is True
-
-    def test_missing_runtime_flag(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--", "npx"],
-        }
-        assert is_wrapped(entry) is False
-
-    def test_missing_separator(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--runtime", "pip"],
-        }
-        assert is_wrapped(entry) is False
-
-    def test_non_proxy_subcommand(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["serve"],
-        }
-        assert is_wrapped(entry) is False
-
-    def test_no_args_at_all(self):
-        entry = {"command": "some-command"}
-        assert is_wrapped(entry) is False
-
-    def test_empty_args(self):
-        entry = {"command": "some-command", "args": []}
-        assert is_wrapped(entry) is False
-
-    def test_args_not_starting_with_proxy(self):
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["--runtime", "pip", "--", "npx"],
-        }
-        assert is_wrapped(entry) is False
-
-    def test_no_args_after_separator(self):
-        # Must have at least one arg after "--"
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--runtime", "pip", "--"],
-        }
-        assert is_wrapped(entry) is False
-
-    def test_runtime_value_present(self):
-        # --runtime without a value after it
-        entry = {
-            "command": FAKE_PROXY,
-            "args": ["proxy", "--runtime", "--", "npx"],
-        }
-        # "--" appears right after --runtime, so "--" would be treated
-        # as the runtime value. This depends on implementation but should
-        # likely fail structural detection because there would be no
-        # actual "--" separator after the runtime value.
-        # The implementation should handle this edge case.
-        # We just verify it does not crash.
-        result = is_wrapped(entry)
-        assert isinstance(result, bool)
+    @pytest.mark.parametrize(
+        "entry,expected",
+        [
+            # fully valid wrapped entry
+            ({"command": FAKE_PROXY, "args": ["proxy", "--runtime", "pip", "--", "npx", "server"]}, True),
+            # wrapped with extra flags
+            ({"command": FAKE_PROXY, "args": ["proxy", "--stats", "--runtime", "pip", "--", "npx"]}, True),
+            # missing runtime flag
+            ({"command": FAKE_PROXY, "args": ["proxy", "--", "npx"]}, False),
+            # missing separator
+            ({"command": FAKE_PROXY, "args": ["proxy", "--runtime", "pip"]}, False),
+            # non-proxy subcommand
+            ({"command": FAKE_PROXY, "args": ["serve"]}, False),
+            # no args at all
+            ({"command": "some-command"}, False),
+            # empty args
+            ({"command": "some-command", "args": []}, False),
+            # args not starting with proxy
+            ({"command": FAKE_PROXY, "args": ["--runtime", "pip", "--", "npx"]}, False),
+            # must have at least one arg after "--"
+            ({"command": FAKE_PROXY, "args": ["proxy", "--runtime", "pip", "--"]}, False),
+            # --runtime without a value: "--" is the separator, not the value
+            ({"command": FAKE_PROXY, "args": ["proxy", "--runtime", "--", "npx"]}, False),
+            # unhashable runtime value is not a known runtime
+            ({"command": FAKE_PROXY, "args": ["proxy", "--runtime", ["pip"], "--", "npx"]}, False),
+        ],
+    )
+    def test_structural_detection(self, entry, expected):
+        assert is_wrapped(entry) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -912,6 +901,13 @@ class TestGetRuntimeExtraction:
         }
         assert get_runtime(entry) == "uv"
 
+    def test_runtime_unhashable_value(self):
+        entry = {
+            "command": FAKE_PROXY,
+            "args": ["proxy", "--runtime", ["x"], "--", "cmd"],
+        }
+        assert get_runtime(entry) == ["x"]
+
 
 # ---------------------------------------------------------------------------
 # Additional edge-case tests
@@ -951,6 +947,33 @@ class TestReadConfigJsonc:
         data = read_config(str(config_path))
         assert data["mcpServers"]["remote"]["url"] == "https://mcp.example.com/sse"
 
+    def test_read_config_cache_returns_fresh_copies_and_tracks_changes(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"mcpServers": {"a": {"command": "x"}}} // old', encoding="utf-8")
+        # Age the file past the racy window so the parse is cached.
+        old = time.time() - 60
+        os.utime(config_path, (old, old))
+        read_config.cache_clear()
+
+        first = read_config(str(config_path))
+        first["mcpServers"]["a"]["command"] = "mutated"
+        assert read_config(str(config_path)) == {"mcpServers": {"a": {"command": "x"}}}
+
+        config_path.write_text('{"mcpServers": {"b": {"command": "y"}}}', encoding="utf-8")
+        assert read_config(str(config_path)) == {"mcpServers": {"b": {"command": "y"}}}
+
+    def test_read_config_identical_jsonc_content_parses_independently(self, tmp_path):
+        content = '{"mcpServers": {/* c */ "a": {"command": "x"}}} // trailing'
+        first_path = tmp_path / "one.json"
+        second_path = tmp_path / "two.json"
+        first_path.write_text(content, encoding="utf-8")
+        second_path.write_text(content, encoding="utf-8")
+        read_config.cache_clear()
+
+        first = read_config(str(first_path))
+        first["mcpServers"]["a"]["command"] = "mutated"
+        assert read_config(str(second_path)) == {"mcpServers": {"a": {"command": "x"}}}
+
 
 class TestClientFilter:
     """Test install/uninstall with client_filter."""
@@ -1134,6 +1157,27 @@ class TestRemoteRegistryCaching:
         assert results[0]["name"] == "test-client"
 
 
+class TestLocalOverridesCaching:
+    """Local overrides are parsed once per unchanged file."""
+
+    def test_cached_overrides_are_copies_and_track_rewrites(self, tmp_path, monkeypatch):
+        import ultra_lean_mcp_proxy.installer as inst
+
+        overrides = tmp_path / "clients.json"
+        overrides.write_text(json.dumps([{"name": "a", "path": "/tmp/a.json"}]), encoding="utf-8")
+        old = time.time() - 60
+        os.utime(overrides, (old, old))
+        monkeypatch.setattr(inst, "LOCAL_OVERRIDES_FILE", overrides)
+        monkeypatch.setattr(inst, "_LOCAL_OVERRIDES_CACHE", {})
+
+        first = inst._load_local_overrides()
+        first[0]["name"] = "mutated"
+        assert [loc["name"] for loc in inst._load_local_overrides()] == ["a"]
+
+        overrides.write_text(json.dumps([{"name": "b", "path": "/tmp/b.json"}]), encoding="utf-8")
+        assert [loc["name"] for loc in inst._load_local_overrides()] == ["b"]
+
+
 # ---------------------------------------------------------------------------
 # Claude CLI parsing tests
 # ---------------------------------------------------------------------------
@@ -1142,24 +1186,31 @@ class TestRemoteRegistryCaching:
 class TestIsSafePropertyName:
     """Test is_safe_property_name validates correctly."""
 
-    def test_valid_names(self):
-        assert is_safe_property_name("linear") is True
-        assert is_safe_property_name("my-server") is True
-        assert is_safe_property_name("my_server.v2") is True
-        assert is_safe_property_name("linear-ulmp") is True
-        assert is_safe_property_name("a") is True
-        assert is_safe_property_name("X123") is True
-
-    def test_invalid_names(self):
-        assert is_safe_property_name("") is False
-        assert is_safe_property_name(None) is False
-        assert is_safe_property_name(42) is False
-        assert is_safe_property_name("__proto__") is False
-        assert is_safe_property_name("constructor") is False
-        assert is_safe_property_name("prototype") is False
-        assert is_safe_property_name("has spaces") is False
-        assert is_safe_property_name(".starts-with-dot") is False
-        assert is_safe_property_name("-starts-with-dash") is False
+    @pytest.mark.parametrize(
+        "name,ok",
+        [
+            ("linear", True),
+            ("my-server", True),
+            ("my_server.v2", True),
+            ("linear-ulmp", True),
+            ("a", True),
+            ("X123", True),
+            ("a" * 128, True),
+            ("a" * 129, False),
+            ("", False),
+            (None, False),
+            (42, False),
+            ("__proto__", False),
+            ("constructor", False),
+            ("prototype", False),
+            ("has spaces", False),
+            (".starts-with-dot", False),
+            ("-starts-with-dash", False),
+            ("trailing-newline\n", False),
+        ],
+    )
+    def test_property_names(self, name, ok):
+        assert is_safe_property_name(name) is ok
 
 
 class TestParseClaudeMcpListNames:
@@ -1198,6 +1249,15 @@ class TestParseClaudeMcpListNames:
         )
         assert parse_claude_mcp_list_names(output) == ["valid-name"]
 
+    def test_splits_on_all_line_boundaries(self):
+        output = (
+            "Checking MCP server health...\r"
+            "github: npx -y server-github - ok\r"
+            "linear: https://mcp.linear.app/sse - ok\x85"
+            "notion: https://mcp.notion.com/sse - ok\f"
+        )
+        assert parse_claude_mcp_list_names(output) == ["github", "linear", "notion"]
+
     def test_handles_empty(self):
         assert parse_claude_mcp_list_names("") == []
         assert parse_claude_mcp_list_names(None) == []
@@ -1361,14 +1421,8 @@ class TestWrapCloud:
         raise RuntimeError(f"unexpected: {args}")
 
     def test_basic(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         result = wrap_cloud(
             dry_run=False,
@@ -1385,19 +1439,32 @@ class TestWrapCloud:
         assert result["written"] == 1
         assert result["skipped"] == 1
 
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         assert "linear-ulmp" in data["mcpServers"]
         assert is_wrapped(data["mcpServers"]["linear-ulmp"])
 
-    def test_dry_run(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
+    def test_gets_each_listed_server_once(self, tmp_path, monkeypatch):
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
+        _patch_claude_user_location(monkeypatch, config_path)
+        calls = []
+
+        def run(args):
+            calls.append(tuple(args))
+            if args[0] == "list":
+                return self._mock_list_output() + "\n" + self._mock_list_output()
+            return self._mock_run(args)
+
+        wrap_cloud(
+            dry_run=True,
+            _command_exists=lambda name: True,
+            _run_command=run,
+            _resolve_proxy=lambda: FAKE_PROXY,
         )
+        assert calls == [("list",), ("get", "linear"), ("get", "local-server")]
+
+    def test_dry_run(self, tmp_path, monkeypatch):
+        config_path = str(tmp_path / ".claude.json")
+        _patch_claude_user_location(monkeypatch, config_path)
 
         result = wrap_cloud(
             dry_run=True,
@@ -1412,14 +1479,8 @@ class TestWrapCloud:
         assert not Path(config_path).exists()
 
     def test_skips_local_scope(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         def mock_run_local_only(args):
             if args[0] == "list":
@@ -1447,14 +1508,8 @@ class TestWrapCloud:
         assert result["skipped"] == 1
 
     def test_skips_non_url(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         def mock_run_cloud_stdio(args):
             if args[0] == "list":
@@ -1490,14 +1545,8 @@ class TestWrapCloud:
             wrap_cloud(suffix="", _command_exists=lambda name: True)
 
     def test_unchanged_detection(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         # Run once to populate
         wrap_cloud(
@@ -1534,8 +1583,6 @@ class TestInstallCloudDiscovery:
 
     def test_install_triggers_cloud_discovery(self, tmp_path, monkeypatch):
         """Install should call wrap_cloud when claude CLI is on PATH."""
-        import ultra_lean_mcp_proxy.installer as inst
-
         servers = {
             "local": {"command": "npx", "args": ["server-local"]},
         }
@@ -1549,11 +1596,7 @@ class TestInstallCloudDiscovery:
 
         # Now verify wrap_cloud works after install (simulating what _run_install does)
         cloud_config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": cloud_config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, cloud_config_path)
 
         mock_list = "\n".join([
             "cloud-api: https://api.example.com/mcp - ok",
@@ -1582,7 +1625,7 @@ class TestInstallCloudDiscovery:
         assert result["candidates"] == 1
         assert result["written"] == 1
 
-        data = json.loads(Path(cloud_config_path).read_text(encoding="utf-8"))
+        data = _read_json(cloud_config_path)
         assert "cloud-api-ulmp" in data["mcpServers"]
         assert is_wrapped(data["mcpServers"]["cloud-api-ulmp"])
 
@@ -1721,19 +1764,28 @@ class TestParseClaudeMcpListCloudConnectors:
         assert len(results) == 1
         assert results[0]["safe_name"] == "my-service"
 
+    @pytest.mark.parametrize("sep", ["\n", "\r\n", "\r", "\x85"])
+    def test_single_pass_classifier_matches_both_parsers(self, sep):
+        output = sep.join([
+            "Checking MCP server health...",
+            "claude.ai Canva: https://mcp.canva.com/mcp - Connected",
+            "linear: https://mcp.linear.app/sse - ok",
+            "CLAUDE.AI Notion: HTTPS://mcp.notion.com/sse - ok",
+            "local-server: npx server - ok",
+            "linear: https://mcp.linear.app/sse - ok",
+        ])
+        names, cloud = _classify_claude_mcp_list_output(output)
+        assert names == parse_claude_mcp_list_names(output) == ["linear", "local-server"]
+        assert cloud == parse_claude_mcp_list_cloud_connectors(output)
+        assert [c["safe_name"] for c in cloud] == ["canva", "notion"]
+
 
 class TestWrapCloudWithCloudConnectors:
     """Test wrap_cloud discovers cloud.ai entries from list output."""
 
     def test_discovers_cloud_ai_canva(self, tmp_path, monkeypatch):
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         mock_list = "\n".join([
             "claude.ai Canva: https://mcp.canva.com/mcp - Connected",
@@ -1769,20 +1821,14 @@ class TestWrapCloudWithCloudConnectors:
         assert result["candidates"] == 1
         assert result["written"] == 1
 
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         assert "canva-ulmp" in data["mcpServers"]
         assert is_wrapped(data["mcpServers"]["canva-ulmp"])
 
     def test_cloud_ai_entries_only_no_standard_names(self, tmp_path, monkeypatch):
         """When list output has only cloud.ai entries (no safe names), still works."""
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         mock_list = "claude.ai Canva: https://mcp.canva.com/mcp - Connected\n"
 
@@ -1806,14 +1852,8 @@ class TestWrapCloudWithCloudConnectors:
 
     def test_dedup_cloud_ai_against_get_flow(self, tmp_path, monkeypatch):
         """If a connector is discovered by both get and cloud parser, no duplicate."""
-        import ultra_lean_mcp_proxy.installer as inst
-
         config_path = str(tmp_path / ".claude.json")
-        monkeypatch.setattr(
-            inst,
-            "get_config_locations",
-            lambda offline=True: [{"name": "claude-code-user", "path": config_path, "key": "mcpServers"}],
-        )
+        _patch_claude_user_location(monkeypatch, config_path)
 
         # 'linear' appears both as standard name AND as cloud.ai prefix
         mock_list = "\n".join([
@@ -1848,5 +1888,5 @@ class TestWrapCloudWithCloudConnectors:
         assert result["candidates"] == 1
         assert result["written"] == 1
 
-        data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        data = _read_json(config_path)
         assert "linear-ulmp" in data["mcpServers"]
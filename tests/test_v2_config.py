@@ -1,7 +1,10 @@
 ﻿"""Tests for v2 proxy config resolution."""
 
 import json
+import os
+import time
 
+from ultra_lean_mcp_proxy import config as config_module
 from ultra_lean_mcp_proxy.config import load_proxy_config
 
 
@@ -185,6 +188,17 @@ def test_tools_hash_sync_env_override_and_validation(tmp_path):
     assert cfg.tools_hash_sync_refresh_interval == 2
 
 
+def test_tools_hash_sync_accepts_blake2_algorithms(tmp_path):
+    config_path = tmp_path / "ultra-lean-mcp-proxy.config.json"
+    for algorithm in ("blake2b", "BLAKE2s"):
+        config_path.write_text(
+            json.dumps({"optimizations": {"tools_hash_sync": {"algorithm": algorithm}}}),
+            encoding="utf-8",
+        )
+        cfg = load_proxy_config(upstream_command=["python", "fake_server.py"], config_path=str(config_path))
+        assert cfg.tools_hash_sync_algorithm == algorithm.lower()
+
+
 def test_tools_hash_sync_invalid_algorithm_raises(tmp_path):
     config_path = tmp_path / "ultra-lean-mcp-proxy.config.json"
     config_path.write_text(
@@ -210,3 +224,105 @@ def test_tools_hash_sync_invalid_algorithm_raises(tmp_path):
     except ValueError as exc:
         assert "tools hash sync algorithm" in str(exc).lower()
 
+
+def _write_settled_config(path, payload, age_seconds=60):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_config_file_cache_returns_isolated_copies(tmp_path):
+    config_path = tmp_path / "ultra-lean-mcp-proxy.config.json"
+    _write_settled_config(
+        config_path,
+        {"servers": {"default": {"tools": {"list_items": {"caching": {"enabled": True}}}}}},
+    )
+
+    first = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(config_path))
+    first.tool_overrides["list_items"]["caching"]["enabled"] = False
+    assert os.path.abspath(config_path) in config_module._CONFIG_FILE_CACHE
+
+    second = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(config_path))
+    assert second.tool_overrides["list_items"]["caching"]["enabled"] is True
+    assert second is not first
+
+
+def test_config_file_cache_invalidates_on_rewrite(tmp_path):
+    config_path = tmp_path / "ultra-lean-mcp-proxy.config.json"
+    _write_settled_config(config_path, {"optimizations": {"caching": {"default_ttl_seconds": 30}}}, age_seconds=120)
+    cfg = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(config_path))
+    assert cfg.cache_ttl_seconds == 30
+
+    _write_settled_config(config_path, {"optimizations": {"caching": {"default_ttl_seconds": 45}}}, age_seconds=60)
+    cfg = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(config_path))
+    assert cfg.cache_ttl_seconds == 45
+
+
+def test_empty_and_bom_prefixed_config_files(tmp_path):
+    empty_path = tmp_path / "empty.json"
+    empty_path.write_bytes(b"")
+    cfg = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(empty_path))
+    assert cfg.source_path == str(empty_path)
+
+    bom_path = tmp_path / "bom.json"
+    bom_path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"proxy": {"stats": True}}).encode("utf-8"))
+    cfg = load_proxy_config(upstream_command=["python", "s.py"], config_path=str(bom_path))
+    assert cfg.stats is True
+
+
+def test_env_overrides_parse_clamp_and_ignore_invalid_values():
+    cfg = load_proxy_config(
+        upstream_command=["python", "s.py"],
+        env={
+            "ULTRA_LEAN_MCP_PROXY_SEARCH_TOP_K": "0",
+            "ULTRA_LEAN_MCP_PROXY_DELTA_MIN_SAVINGS": "1.5",
+            "ULTRA_LEAN_MCP_PROXY_CACHE_TTL_SECONDS": "soon",
+            "ULTRA_LEAN_MCP_PROXY_CACHING": "maybe",
+            "ULTRA_LEAN_MCP_PROXY_STATS": "yes",
+            "ULTRA_LEAN_MCP_PROXY_SESSION_ID": "",
+        },
+    )
+    defaults = config_module.ProxyConfig()
+    assert cfg.lazy_top_k == 1
+    assert cfg.delta_min_savings_ratio == 1.0
+    assert cfg.cache_ttl_seconds == defaults.cache_ttl_seconds
+    assert cfg.caching_enabled == defaults.caching_enabled
+    assert cfg.stats is True
+    assert cfg.session_id == defaults.session_id
+
+
+def test_server_profile_first_matching_entry_wins(tmp_path):
+    config_path = tmp_path / "ultra-lean-mcp-proxy.config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "servers": {
+                    "default": {"optimizations": {"caching": {"default_ttl_seconds": 11}}},
+                    "broad": {"match": {"command_contains": "server-"}},
+                    "github": {
+                        "match": {"command_contains": "server-github"},
+                        "optimizations": {"caching": {"default_ttl_seconds": 30}},
+                    },
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    cfg = load_proxy_config(
+        upstream_command=["npx", "@modelcontextprotocol/server-github"],
+        config_path=str(config_path),
+    )
+    assert cfg.server_name == "broad"
+    assert cfg.cache_ttl_seconds == 11
+
+
+def test_proxy_config_is_slotted_but_mutable():
+    cfg = config_module.ProxyConfig()
+    cfg.lazy_min_tokens = 99999
+    assert cfg.lazy_min_tokens == 99999
+    assert not hasattr(cfg, "__dict__")
+    try:
+        cfg.lazy_min_token = 1
+        assert False, "expected AttributeError for unknown config attribute"
+    except AttributeError:
+        pass
@@ -1,5 +1,7 @@
 """Tests for delta response helpers (structural JSON diff)."""
 
+import json
+
 import pytest
 
 from ultra_lean_mcp_proxy.delta import (
@@ -9,6 +11,9 @@ from ultra_lean_mcp_proxy.delta import (
     _diff_values,
     canonicalize,
     _clone_json,
+    _BudgetExceeded,
+    _json_bytes,
+    _op_bytes_lower_bound,
 )
 
 # Use a very negative threshold to test ops-level correctness
@@ -133,6 +138,7 @@ def test_delta_bytes_fields():
     assert isinstance(delta["savedBytes"], int)
     assert isinstance(delta["savedRatio"], float)
     assert delta["savedBytes"] == delta["fullBytes"] - delta["patchBytes"]
+    assert delta["fullBytes"] == len(json.dumps(current, separators=(",", ":")).encode("utf-8"))
 
 
 def test_apply_delta_rejects_bad_encoding():
@@ -194,3 +200,98 @@ def test_diff_values_delete_op():
     assert len(ops) == 1
     assert ops[0]["op"] == "delete"
     assert ops[0]["path"] == ["b"]
+
+
+def test_diff_values_emits_ops_in_depth_first_key_order():
+    ops = []
+    _diff_values(
+        canonicalize({"a": {"x": 1, "y": [1, 2]}, "b": 1, "c": 2}),
+        canonicalize({"a": {"x": 2, "y": [1, 3]}, "c": 2, "d": 4}),
+        [],
+        ops,
+    )
+    assert [(op["op"], op["path"]) for op in ops] == [
+        ("set", ["a", "x"]),
+        ("set", ["a", "y", 1]),
+        ("delete", ["b"]),
+        ("set", ["d"]),
+    ]
+
+
+def test_diff_values_treats_numeric_types_like_json():
+    ops = []
+    _diff_values({"a": 1, "b": 1, "c": 0.0}, {"a": 1.0, "b": True, "c": -0.0}, [], ops)
+    assert [op["path"] for op in ops] == [["a"], ["b"], ["c"]]
+
+
+def test_diff_values_skips_shared_subtrees():
+    shared = {"rows": [{"id": i} for i in range(10)]}
+    ops = []
+    _diff_values({"meta": shared, "n": 1}, {"meta": shared, "n": 2}, [], ops)
+    assert ops == [{"op": "set", "path": ["n"], "value": 2}]
+
+
+def test_diff_values_stops_once_budget_is_exceeded():
+    previous = {f"k{i}": i for i in range(50)}
+    current = {f"k{i}": i + 1 for i in range(50)}
+    ops = []
+    with pytest.raises(_BudgetExceeded):
+        _diff_values(previous, current, [], ops, budget=100)
+    assert 0 < len(ops) < 50
+
+
+def test_op_bytes_lower_bound_never_exceeds_serialized_size():
+    ops = [
+        {"op": "delete", "path": ["a", 3, "k\u00e9"]},
+        {"op": "set", "path": [], "value": {"x": [1, 2]}},
+        {"op": "set", "path": ["quote\"d"], "value": "line\nbreak"},
+    ]
+    assert 1 + sum(_op_bytes_lower_bound(op) for op in ops) <= _json_bytes(ops)
+    ascii_delete = {"op": "delete", "path": ["items", 3, "title"]}
+    assert 1 + _op_bytes_lower_bound(ascii_delete) == _json_bytes([ascii_delete])
+
+
+def test_clone_json_matches_json_round_trip():
+    shared = {"k": [1, 2.5, None, True, "s"]}
+    value = {"a": shared, "b": [shared, {"c": {}}]}
+    clone = _clone_json(value)
+    assert clone == value
+    assert clone["a"] is not shared
+    assert clone["b"][0] is not clone["a"]
+    assert _clone_json({"t": (1, 2), 1: "x"}) == {"t": [1, 2], "1": "x"}
+
+
+def test_clone_json_rejects_cycles_like_json():
+    cyclic = []
+    cyclic.append(cyclic)
+    with pytest.raises(ValueError):
+        _clone_json(cyclic)
+
+
+def test_apply_delta_inplace_patches_the_baseline():
+    previous = {"items": [{"id": 1, "status": "open"}], "count": 1}
+    current = {"items": [{"id": 1, "status": "closed"}], "count": 1}
+    delta = create_delta(previous, current, min_savings_ratio=NO_THRESHOLD)
+
+    copied = apply_delta(previous, delta)
+    assert copied == current
+    assert previous["items"][0]["status"] == "open"
+
+    patched = apply_delta(previous, delta, inplace=True)
+    assert patched is previous
+    assert previous == current
+
+
+def test_diff_values_emits_independent_list_paths():
+    ops = []
+    _diff_values({"a": {"x": 1, "y": 2}}, {"a": {"x": 3, "y": 4}}, ["root"], ops)
+    assert [op["path"] for op in ops] == [["root", "a", "x"], ["root", "a", "y"]]
+    assert all(type(op["path"]) is list for op in ops)
+    ops[0]["path"].append("mutated")
+    assert ops[1]["path"] == ["root", "a", "y"]
+
+
+def test_diff_values_equal_length_scalar_lists():
+    ops = []
+    _diff_values([1, 2, "a", None, 1.0, 0.0], [1, 3, "a", None, 1, -0.0], ["xs"], ops)
+    assert [op["path"] for op in ops] == [["xs", 1], ["xs", 4], ["xs", 5]]
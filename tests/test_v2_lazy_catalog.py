@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import pickle
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from ultra_lean_mcp_proxy.config import ProxyConfig
 from ultra_lean_mcp_proxy.proxy import (
@@ -14,26 +23,56 @@ from ultra_lean_mcp_proxy.proxy import (
     _strip_schema_metadata,
 )
 from ultra_lean_mcp_proxy.result_compression import TokenCounter
-from ultra_lean_mcp_proxy.state import ProxyState, clone_json
+from ultra_lean_mcp_proxy.state import ProxyState
 
 
 def _make_tools(n: int) -> list[dict]:
-    """Generate n sample tools with realistic schemas."""
-    return [
+    """Generate n sample tools with realistic schemas (a fresh copy per call)."""
+    return json.loads(_make_tools_bytes(n))
+
+
+# Schema shared by every generated tool; json.dumps serializes it per tool, so
+# aliasing it inside the list is harmless.
+_TOOL_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "param_a": {"type": "string", "description": "First parameter"},
+        "param_b": {"type": "integer", "description": "Second parameter"},
+    },
+    "required": ["param_a"],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_tools_bytes(n: int) -> bytes:
+    return json.dumps([
         {
             "name": f"tool_{i}",
             "description": f"Description for tool {i} that does something useful.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "param_a": {"type": "string", "description": "First parameter"},
-                    "param_b": {"type": "integer", "description": "Second parameter"},
-                },
-                "required": ["param_a"],
-            },
+            "inputSchema": _TOOL_INPUT_SCHEMA,
         }
         for i in range(n)
-    ]
+    ], separators=(",", ":")).encode("utf-8")
+
+
+class _LengthSink:
+    """Write-only text sink that keeps just a running UTF-8 byte count."""
+
+    def __init__(self) -> None:
+        self.length = 0
+
+    def write(self, chunk: str) -> int:
+        self.length += len(chunk.encode("utf-8"))
+        return len(chunk)
+
+
+def _json_len(value) -> int:
+    """Compact UTF-8 JSON size of value in bytes, comparable with the fixture bytes."""
+    if orjson is not None:
+        return len(orjson.dumps(value))
+    sink = _LengthSink()
+    json.dump(value, sink, separators=(",", ":"), ensure_ascii=False)
+    return sink.length
 
 
 def _cfg(*, lazy_mode: str = "catalog", min_tools: int = 5) -> ProxyConfig:
@@ -47,13 +86,37 @@ def _cfg(*, lazy_mode: str = "catalog", min_tools: int = 5) -> ProxyConfig:
     )
 
 
+# Marks the catalog section of the search tool description; absent in the
+# minimal and search_only descriptions.
+_CATALOG_HEADER = "Available tools"
+
+_TOOL_NAMES_10 = frozenset(f"tool_{i}" for i in range(10))
+
+
+def _search_tool(out: dict) -> dict:
+    """Return the search meta-tool, which _handle_tools_list_result appends last."""
+    tools = out["tools"]
+    if tools and tools[-1]["name"] == SEARCH_TOOL_NAME:
+        return tools[-1]
+    return next(t for t in tools if t["name"] == SEARCH_TOOL_NAME)
+
+
+def _clone(value):
+    """Deep-copy a fixture payload.
+
+    Fixtures come straight from json.loads, so a pickle round trip gives the
+    same tree as clone_json and is cheaper.
+    """
+    return pickle.loads(pickle.dumps(value, protocol=5))
+
+
 def _run(tools: list[dict], config: ProxyConfig) -> dict:
     result = {"tools": tools}
     state = ProxyState(max_cache_entries=100)
     metrics = ProxyMetrics()
     counter = TokenCounter()
     return _handle_tools_list_result(
-        clone_json(result),
+        _clone(result),
         state,
         config,
         metrics,
@@ -63,83 +126,92 @@ def _run(tools: list[dict], config: ProxyConfig) -> dict:
     )
 
 
+# --- shared lazy-mode outputs (built once per module; tests only read them) ---
+
+
+@pytest.fixture(scope="module")
+def catalog_out_10() -> dict:
+    return _run(_make_tools(10), _cfg(lazy_mode="catalog"))
+
+
+@pytest.fixture(scope="module")
+def catalog_out_6() -> dict:
+    return _run(_make_tools(6), _cfg(lazy_mode="catalog"))
+
+
+@pytest.fixture(scope="module")
+def minimal_out_10() -> dict:
+    return _run(_make_tools(10), _cfg(lazy_mode="minimal"))
+
+
+@pytest.fixture(scope="module")
+def search_only_out_10() -> dict:
+    return _run(_make_tools(10), _cfg(lazy_mode="search_only"))
+
+
 # --- catalog mode tests ---
 
 
-def test_catalog_mode_sends_bare_stubs_plus_search_tool():
+def test_catalog_mode_sends_bare_stubs_plus_search_tool(catalog_out_10):
     """Catalog mode should send bare-minimum callable entries + the search meta-tool."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="catalog"))
+    out = catalog_out_10
     # 10 bare stubs + 1 search tool
     assert len(out["tools"]) == 11
-    names = [t["name"] for t in out["tools"]]
+    names = {t["name"] for t in out["tools"]}
     assert SEARCH_TOOL_NAME in names
-    for i in range(10):
-        assert f"tool_{i}" in names
+    assert names.issuperset(_TOOL_NAMES_10)
 
 
-def test_catalog_mode_bare_stubs_have_no_description_or_properties():
+def test_catalog_mode_bare_stubs_have_no_description_or_properties(catalog_out_10):
     """Catalog bare stubs should have only name + empty object schema."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="catalog"))
-    stubs = [t for t in out["tools"] if t["name"] != SEARCH_TOOL_NAME]
+    stubs = [t for t in catalog_out_10["tools"] if t["name"] != SEARCH_TOOL_NAME]
     for stub in stubs:
         assert "description" not in stub
         assert stub["inputSchema"] == {"type": "object"}
 
 
-def test_catalog_mode_embeds_tool_names_in_description():
+@pytest.mark.parametrize("i", range(10))
+def test_catalog_mode_embeds_tool_names_in_description(catalog_out_10, i):
     """Catalog mode should list all tool names in the search tool description."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="catalog"))
-    search_tool = next(t for t in out["tools"] if t["name"] == SEARCH_TOOL_NAME)
-    desc = search_tool["description"]
-    for i in range(10):
-        assert f"tool_{i}" in desc
+    search_tool = _search_tool(catalog_out_10)
+    assert f"tool_{i}" in search_tool["description"]
 
 
-def test_catalog_mode_description_contains_available_tools_header():
+def test_catalog_mode_description_contains_available_tools_header(catalog_out_6):
     """Catalog mode description should have the standard header."""
-    tools = _make_tools(6)
-    out = _run(tools, _cfg(lazy_mode="catalog"))
-    search_tool = next(t for t in out["tools"] if t["name"] == SEARCH_TOOL_NAME)
-    assert "Available tools" in search_tool["description"]
+    search_tool = _search_tool(catalog_out_6)
+    assert _CATALOG_HEADER in search_tool["description"]
     assert "select:" in search_tool["description"]
 
 
 # --- minimal mode tests ---
 
 
-def test_minimal_mode_sends_stubs_plus_search_tool():
+def test_minimal_mode_sends_stubs_plus_search_tool(minimal_out_10):
     """Minimal mode should send tool stubs + the search meta-tool."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="minimal"))
+    out = minimal_out_10
     # 10 stubs + 1 search tool
     assert len(out["tools"]) == 11
-    names = [t["name"] for t in out["tools"]]
+    names = {t["name"] for t in out["tools"]}
     assert SEARCH_TOOL_NAME in names
-    for i in range(10):
-        assert f"tool_{i}" in names
+    assert names.issuperset(_TOOL_NAMES_10)
 
 
-def test_minimal_mode_does_not_embed_names_in_description():
+def test_minimal_mode_does_not_embed_names_in_description(minimal_out_10):
     """Minimal mode search tool should have a simple description."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="minimal"))
-    search_tool = next(t for t in out["tools"] if t["name"] == SEARCH_TOOL_NAME)
-    assert "Available tools" not in search_tool["description"]
+    search_tool = _search_tool(minimal_out_10)
+    assert _CATALOG_HEADER not in search_tool["description"]
 
 
 # --- search_only mode tests ---
 
 
-def test_search_only_mode_sends_only_search_tool():
+def test_search_only_mode_sends_only_search_tool(search_only_out_10):
     """search_only should send just the search meta-tool with no names."""
-    tools = _make_tools(10)
-    out = _run(tools, _cfg(lazy_mode="search_only"))
+    out = search_only_out_10
     assert len(out["tools"]) == 1
     assert out["tools"][0]["name"] == SEARCH_TOOL_NAME
-    assert "Available tools" not in out["tools"][0]["description"]
+    assert _CATALOG_HEADER not in out["tools"][0]["description"]
 
 
 # --- threshold tests ---
@@ -162,8 +234,8 @@ def test_lazy_loading_activates_at_threshold():
     out = _run(tools, _cfg(lazy_mode="catalog", min_tools=10))
     # 10 bare stubs + 1 search tool
     assert len(out["tools"]) == 11
-    search_tool = next(t for t in out["tools"] if t["name"] == SEARCH_TOOL_NAME)
-    assert "Available tools" in search_tool["description"]
+    search_tool = _search_tool(out)
+    assert _CATALOG_HEADER in search_tool["description"]
 
 
 # --- _build_search_tool_definition unit tests ---
@@ -173,44 +245,81 @@ def test_build_search_tool_without_names():
     """Without tool names, description should be the base description."""
     tool = _build_search_tool_definition()
     assert tool["name"] == SEARCH_TOOL_NAME
-    assert "Available tools" not in tool["description"]
+    assert _CATALOG_HEADER not in tool["description"]
     assert "query" in tool["inputSchema"]["properties"]
 
 
-def test_build_search_tool_with_names():
+@pytest.mark.parametrize("name", ["create_issue", "list_issues", "search_designs"])
+def test_build_search_tool_with_names(name):
     """With tool names, description should embed them."""
     names = ["create_issue", "list_issues", "search_designs"]
     tool = _build_search_tool_definition(tool_names=names)
-    assert "create_issue" in tool["description"]
-    assert "list_issues" in tool["description"]
-    assert "search_designs" in tool["description"]
-    assert "Available tools" in tool["description"]
+    assert name in tool["description"]
+    assert _CATALOG_HEADER in tool["description"]
 
 
 def test_build_search_tool_with_empty_list():
     """Empty tool names list should produce base description."""
     tool = _build_search_tool_definition(tool_names=[])
-    assert "Available tools" not in tool["description"]
+    assert _CATALOG_HEADER not in tool["description"]
 
 
 # --- token savings comparison ---
 
 
+@pytest.mark.slow
 def test_catalog_mode_smaller_than_minimal():
     """Catalog mode output should be significantly smaller than minimal."""
     tools = _make_tools(20)
     catalog_out = _run(tools, _cfg(lazy_mode="catalog"))
     minimal_out = _run(tools, _cfg(lazy_mode="minimal"))
-    catalog_size = len(json.dumps(catalog_out))
-    minimal_size = len(json.dumps(minimal_out))
+    catalog_size = _json_len(catalog_out)
+    minimal_size = _json_len(minimal_out)
     assert catalog_size < minimal_size * 0.5, (
         f"Catalog ({catalog_size}B) should be <50% of minimal ({minimal_size}B)"
     )
 
 
 def _make_rich_tools(n: int) -> list[dict]:
-    """Generate tools with rich schemas that have things to strip."""
-    return [
+    """Generate tools with rich schemas that have things to strip (a fresh copy per call)."""
+    return json.loads(_make_rich_tools_bytes(n))
+
+
+# Property schemas shared by every rich tool (only name, description and title vary).
+_RICH_TOOL_PROPERTIES = {
+    "param_a": {
+        "type": "string",
+        "description": "First parameter for the tool",
+        "title": "ParamA",
+        "examples": ["example1", "example2"],
+        "default": "example1",
+    },
+    "param_b": {
+        "type": "object",
+        "description": "Nested config object with several fields",
+        "title": "ParamB",
+        "additionalProperties": False,
+        "properties": {
+            "field_x": {
+                "type": "string",
+                "description": "Deeply nested description that should be stripped",
+                "title": "FieldX",
+                "examples": ["x1"],
+            },
+            "field_y": {
+                "type": "integer",
+                "description": "Another deeply nested description to strip",
+                "default": 42,
+            },
+        },
+        "required": ["field_x"],
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_rich_tools_bytes(n: int) -> bytes:
+    return json.dumps([
         {
             "name": f"tool_{i}",
             "description": f"Description for tool {i} that does something useful and important.",
@@ -219,42 +328,15 @@ def _make_rich_tools(n: int) -> list[dict]:
                 "title": f"Tool{i}Schema",
                 "$schema": "http://json-schema.org/draft-07/schema#",
                 "additionalProperties": False,
-                "properties": {
-                    "param_a": {
-                        "type": "string",
-                        "description": "First parameter for the tool",
-                        "title": "ParamA",
-                        "examples": ["example1", "example2"],
-                        "default": "example1",
-                    },
-                    "param_b": {
-                        "type": "object",
-                        "description": "Nested config object with several fields",
-                        "title": "ParamB",
-                        "additionalProperties": False,
-                        "properties": {
-                            "field_x": {
-                                "type": "string",
-                                "description": "Deeply nested description that should be stripped",
-                                "title": "FieldX",
-                                "examples": ["x1"],
-                            },
-                            "field_y": {
-                                "type": "integer",
-                                "description": "Another deeply nested description to strip",
-                                "default": 42,
-                            },
-                        },
-                        "required": ["field_x"],
-                    },
-                },
+                "properties": _RICH_TOOL_PROPERTIES,
                 "required": ["param_a"],
             },
         }
         for i in range(n)
-    ]
+    ], separators=(",", ":")).encode("utf-8")
 
 
+@pytest.mark.slow
 def test_enhanced_minimal_between_full_and_catalog():
     """Enhanced minimal stubs should be smaller than full schemas but larger than catalog stubs."""
     tools = _make_rich_tools(20)
@@ -263,9 +345,9 @@ def test_enhanced_minimal_between_full_and_catalog():
     # Compare only the tool stubs (exclude search meta-tool) for fair comparison
     catalog_stubs = [t for t in catalog_out["tools"] if t["name"] != SEARCH_TOOL_NAME]
     minimal_stubs = [t for t in minimal_out["tools"] if t["name"] != SEARCH_TOOL_NAME]
-    full_size = len(json.dumps(tools))
-    catalog_size = len(json.dumps(catalog_stubs))
-    minimal_size = len(json.dumps(minimal_stubs))
+    full_size = len(_make_rich_tools_bytes(20))
+    catalog_size = _json_len(catalog_stubs)
+    minimal_size = _json_len(minimal_stubs)
     assert catalog_size < minimal_size < full_size, (
         f"Expected catalog ({catalog_size}) < minimal ({minimal_size}) < full ({full_size})"
     )
@@ -274,23 +356,27 @@ def test_enhanced_minimal_between_full_and_catalog():
 # --- enhanced minimal mode: _strip_schema_metadata unit tests ---
 
 
-def test_strip_preserves_nested_object_properties():
-    """Nested object properties should be recursively preserved."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "format": {
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["pdf", "png", "jpg"]},
-                    "quality": {"type": "integer", "minimum": 1, "maximum": 100},
-                },
-                "required": ["type"],
+# Larger input schemas are shared module constants; _strip_schema_metadata
+# builds a fresh output and never mutates its input.
+_NESTED_OBJECT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "format": {
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["pdf", "png", "jpg"]},
+                "quality": {"type": "integer", "minimum": 1, "maximum": 100},
             },
+            "required": ["type"],
         },
-        "required": ["format"],
-    }
-    result = _strip_schema_metadata(schema, 0)
+    },
+    "required": ["format"],
+}
+
+
+def test_strip_preserves_nested_object_properties():
+    """Nested object properties should be recursively preserved."""
+    result = _strip_schema_metadata(_NESTED_OBJECT_SCHEMA, 0)
     assert result["type"] == "object"
     assert result["required"] == ["format"]
     fmt = result["properties"]["format"]
@@ -301,50 +387,27 @@ def test_strip_preserves_nested_object_properties():
     assert fmt["properties"]["quality"]["maximum"] == 100
 
 
-def test_strip_preserves_required_arrays():
-    """required arrays must survive stripping."""
-    schema = {
-        "type": "object",
-        "properties": {"a": {"type": "string"}, "b": {"type": "integer"}},
-        "required": ["a", "b"],
-    }
-    result = _strip_schema_metadata(schema, 0)
-    assert result["required"] == ["a", "b"]
-
-
-def test_strip_preserves_enum_values():
-    """enum arrays must survive stripping."""
-    schema = {"type": "string", "enum": ["pdf", "png", "svg"]}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["enum"] == ["pdf", "png", "svg"]
-
-
-def test_strip_preserves_format():
-    """format string must survive stripping."""
-    schema = {"type": "string", "format": "uri"}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["format"] == "uri"
+_DEPTH2_SCHEMA = {
+    "type": "object",
+    "description": "Root description",
+    "properties": {
+        "child": {
+            "type": "object",
+            "description": "Depth 1 description",
+            "properties": {
+                "grandchild": {
+                    "type": "string",
+                    "description": "Depth 2 description -- should be stripped",
+                }
+            },
+        }
+    },
+}
 
 
 def test_strip_removes_descriptions_at_depth_gt_1():
     """Descriptions should be kept at depth 0-1 but stripped deeper."""
-    schema = {
-        "type": "object",
-        "description": "Root description",
-        "properties": {
-            "child": {
-                "type": "object",
-                "description": "Depth 1 description",
-                "properties": {
-                    "grandchild": {
-                        "type": "string",
-                        "description": "Depth 2 description -- should be stripped",
-                    }
-                },
-            }
-        },
-    }
-    result = _strip_schema_metadata(schema, 0)
+    result = _strip_schema_metadata(_DEPTH2_SCHEMA, 0)
     assert "description" in result  # depth 0
     child = result["properties"]["child"]
     assert "description" in child  # depth 1
@@ -401,20 +464,6 @@ def test_strip_preserves_items_in_arrays():
     assert items["properties"]["tags"]["items"]["type"] == "string"
 
 
-def test_strip_preserves_anyof_oneof_allof():
-    """anyOf, oneOf, allOf variants should be recursively preserved."""
-    schema = {
-        "anyOf": [
-            {"type": "string", "enum": ["a", "b"]},
-            {"type": "object", "properties": {"x": {"type": "integer"}}},
-        ]
-    }
-    result = _strip_schema_metadata(schema, 0)
-    assert len(result["anyOf"]) == 2
-    assert result["anyOf"][0]["enum"] == ["a", "b"]
-    assert result["anyOf"][1]["properties"]["x"]["type"] == "integer"
-
-
 def test_minimal_tool_compresses_description():
     """minimalTool should compress descriptions."""
     tool = {
@@ -464,38 +513,40 @@ def test_minimal_tool_preserves_nested_structure():
 # --- M1: depth 3+ description stripping ---
 
 
+_DEPTH4_SCHEMA = {
+    "type": "object",
+    "description": "depth 0 - kept",
+    "properties": {
+        "l1": {
+            "type": "object",
+            "description": "depth 1 - kept",
+            "properties": {
+                "l2": {
+                    "type": "object",
+                    "description": "depth 2 - stripped",
+                    "properties": {
+                        "l3": {
+                            "type": "object",
+                            "description": "depth 3 - stripped",
+                            "properties": {
+                                "l4": {
+                                    "type": "string",
+                                    "description": "depth 4 - stripped",
+                                }
+                            },
+                            "required": ["l4"],
+                        }
+                    },
+                }
+            },
+        }
+    },
+}
+
+
 def test_strip_descriptions_at_depth_3_and_4():
     """Descriptions at depth 3+ should be stripped, while structure is preserved."""
-    schema = {
-        "type": "object",
-        "description": "depth 0 - kept",
-        "properties": {
-            "l1": {
-                "type": "object",
-                "description": "depth 1 - kept",
-                "properties": {
-                    "l2": {
-                        "type": "object",
-                        "description": "depth 2 - stripped",
-                        "properties": {
-                            "l3": {
-                                "type": "object",
-                                "description": "depth 3 - stripped",
-                                "properties": {
-                                    "l4": {
-                                        "type": "string",
-                                        "description": "depth 4 - stripped",
-                                    }
-                                },
-                                "required": ["l4"],
-                            }
-                        },
-                    }
-                },
-            }
-        },
-    }
-    result = _strip_schema_metadata(schema, 0)
+    result = _strip_schema_metadata(_DEPTH4_SCHEMA, 0)
     assert "description" in result  # depth 0
     l1 = result["properties"]["l1"]
     assert "description" in l1  # depth 1
@@ -510,79 +561,84 @@ def test_strip_descriptions_at_depth_3_and_4():
     assert l4["type"] == "string"
 
 
-# --- M2: array type values ---
-
-
-def test_strip_preserves_array_type_values():
-    """type: ["string", "null"] (nullable) should be preserved."""
-    schema = {"type": ["string", "null"], "minLength": 1}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["type"] == ["string", "null"]
-    assert result["minLength"] == 1
-
-
-# --- C1: const, pattern, not ---
-
-
-def test_strip_preserves_const():
-    """const values must survive stripping."""
-    schema = {"const": "fixed_value"}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["const"] == "fixed_value"
-
-
-def test_strip_preserves_const_null():
-    """const: null must survive stripping."""
-    schema = {"const": None}
-    result = _strip_schema_metadata(schema, 0)
-    assert "const" in result
-    assert result["const"] is None
-
-
-def test_strip_preserves_pattern():
-    """pattern strings must survive stripping."""
-    schema = {"type": "string", "pattern": "^[A-Z]{2}$"}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["pattern"] == "^[A-Z]{2}$"
-
-
-def test_strip_preserves_not():
-    """not combinator must be recursively preserved."""
-    schema = {
-        "not": {"type": "string", "enum": ["forbidden"]}
-    }
-    result = _strip_schema_metadata(schema, 0)
-    assert result["not"]["type"] == "string"
-    assert result["not"]["enum"] == ["forbidden"]
-
-
-# --- M5: $ref ---
-
-
-def test_strip_preserves_ref():
-    """$ref strings must survive stripping."""
-    schema = {"$ref": "#/definitions/User"}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["$ref"] == "#/definitions/User"
-
+# --- keyword preservation (table-driven) ---
 
-# --- M4: validation keywords ---
-
-
-def test_strip_preserves_min_max_length():
-    """minLength/maxLength must survive stripping."""
-    schema = {"type": "string", "minLength": 5, "maxLength": 100}
-    result = _strip_schema_metadata(schema, 0)
-    assert result["minLength"] == 5
-    assert result["maxLength"] == 100
-
-
-def test_strip_preserves_min_max_items():
-    """minItems/maxItems must survive stripping."""
-    schema = {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 10}
+# Each case maps an input schema to the top-level keys the stripped output
+# must carry, compared by equality.
+_STRIP_CASES = [
+    pytest.param(
+        {
+            "type": "object",
+            "properties": {"a": {"type": "string"}, "b": {"type": "integer"}},
+            "required": ["a", "b"],
+        },
+        {"required": ["a", "b"]},
+        id="required",
+    ),
+    pytest.param(
+        {"type": "string", "enum": ["pdf", "png", "svg"]},
+        {"enum": ["pdf", "png", "svg"]},
+        id="enum",
+    ),
+    pytest.param({"type": "string", "format": "uri"}, {"format": "uri"}, id="format"),
+    pytest.param(
+        {
+            "anyOf": [
+                {"type": "string", "enum": ["a", "b"]},
+                {"type": "object", "properties": {"x": {"type": "integer"}}},
+            ]
+        },
+        {
+            "anyOf": [
+                {"type": "string", "enum": ["a", "b"]},
+                {"type": "object", "properties": {"x": {"type": "integer"}}},
+            ]
+        },
+        id="anyOf",
+    ),
+    pytest.param(
+        {"type": ["string", "null"], "minLength": 1},
+        {"type": ["string", "null"], "minLength": 1},
+        id="array-type",
+    ),
+    pytest.param({"const": "fixed_value"}, {"const": "fixed_value"}, id="const"),
+    pytest.param({"const": None}, {"const": None}, id="const-null"),
+    pytest.param(
+        {"type": "string", "pattern": "^[A-Z]{2}$"},
+        {"pattern": "^[A-Z]{2}$"},
+        id="pattern",
+    ),
+    pytest.param(
+        {"not": {"type": "string", "enum": ["forbidden"]}},
+        {"not": {"type": "string", "enum": ["forbidden"]}},
+        id="not",
+    ),
+    pytest.param({"$ref": "#/definitions/User"}, {"$ref": "#/definitions/User"}, id="ref"),
+    pytest.param(
+        {"type": "string", "minLength": 5, "maxLength": 100},
+        {"minLength": 5, "maxLength": 100},
+        id="min-max-length",
+    ),
+    pytest.param(
+        {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 10},
+        {"minItems": 1, "maxItems": 10},
+        id="min-max-items",
+    ),
+    pytest.param(
+        {"type": "array", "items": [{"type": "string"}, {"type": "integer", "minimum": 0}]},
+        {"items": [{"type": "string"}, {"type": "integer", "minimum": 0}]},
+        id="items-as-array",
+    ),
+]
+
+
+@pytest.mark.parametrize("schema,expected", _STRIP_CASES)
+def test_strip_preserves_keyword(schema, expected):
+    """Validation keywords must survive stripping unchanged."""
     result = _strip_schema_metadata(schema, 0)
-    assert result["minItems"] == 1
-    assert result["maxItems"] == 10
+    for key, value in expected.items():
+        assert key in result
+        assert result[key] == value
 
 
 # --- H1: reference sharing ---
@@ -604,26 +660,6 @@ def test_strip_copies_enum_array():
     assert schema["enum"] == ["x", "y"]  # original unchanged
 
 
-# --- H2: items as array (tuple validation) ---
-
-
-def test_strip_preserves_items_as_array():
-    """items as array (tuple validation) should be recursively preserved."""
-    schema = {
-        "type": "array",
-        "items": [
-            {"type": "string"},
-            {"type": "integer", "minimum": 0},
-        ],
-    }
-    result = _strip_schema_metadata(schema, 0)
-    assert isinstance(result["items"], list)
-    assert len(result["items"]) == 2
-    assert result["items"][0]["type"] == "string"
-    assert result["items"][1]["type"] == "integer"
-    assert result["items"][1]["minimum"] == 0
-
-
 # --- C2: empty inputSchema {} ---
 
 
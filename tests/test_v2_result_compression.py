@@ -2,6 +2,7 @@
 
 from ultra_lean_mcp_proxy.result_compression import (
     CompressionOptions,
+    TokenCounter,
     compress_result,
     decompress_result,
     estimate_compressibility,
@@ -72,3 +73,28 @@ def test_compressibility_score_higher_for_repetitive_payloads():
     }
     assert estimate_compressibility(repetitive) > estimate_compressibility(diverse)
 
+
+def test_count_at_least_matches_count_for_heuristic_backend():
+    counter = TokenCounter()
+    counter._enc = None
+    payload = {"tools": [{"name": f"tool_{i}", "description": "x" * i} for i in range(20)]}
+    tokens = counter.count(payload)
+    assert counter.count_at_least(payload, tokens)
+    assert not counter.count_at_least(payload, tokens + 1)
+
+
+def test_count_at_least_skips_tokenizer_for_short_text():
+    class _RecordingEncoding:
+        calls = 0
+
+        def encode(self, text):
+            self.calls += 1
+            return list(text.encode("utf-8"))
+
+    counter = TokenCounter()
+    counter._enc = _RecordingEncoding()
+    payload = {"name": "short"}
+    assert not counter.count_at_least(payload, 1000)
+    assert counter._enc.calls == 0
+    assert counter.count_at_least(payload, 5)
+    assert counter._enc.calls == 1
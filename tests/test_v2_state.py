@@ -13,6 +13,14 @@ def test_cache_set_get_and_expire():
     assert state.cache_get(key) is None
 
 
+def test_cache_expiry_ignores_wall_clock_jumps(monkeypatch):
+    state = ProxyState(max_cache_entries=10)
+    state.cache_set("k", {"ok": True}, ttl_seconds=60)
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 3600)
+    assert state.cache_get("k") == {"ok": True}
+
+
 def test_cache_retrieves_cloned_value():
     state = ProxyState(max_cache_entries=10)
     key = make_cache_key("s1", "srv", "list_items", {"page": 1})
@@ -39,6 +47,41 @@ def test_cache_invalidate_prefix_removes_expected_entries():
     assert state.cache_get(k3) == {"ok": 3}
 
 
+def test_cache_evicts_least_recently_used_entry():
+    state = ProxyState(max_cache_entries=2)
+    state.cache_set("a", {"v": "a"}, ttl_seconds=60)
+    state.cache_set("b", {"v": "b"}, ttl_seconds=60)
+    assert state.cache_get("a") == {"v": "a"}  # "b" is now least recently used
+    state.cache_set("c", {"v": "c"}, ttl_seconds=60)
+    assert state.cache_get("b") is None
+    assert state.cache_get("a") == {"v": "a"}
+    assert state.cache_get("c") == {"v": "c"}
+
+
+def test_cache_set_refreshes_recency_of_existing_key():
+    state = ProxyState(max_cache_entries=2)
+    state.cache_set("a", {"v": 1}, ttl_seconds=60)
+    state.cache_set("b", {"v": 2}, ttl_seconds=60)
+    state.cache_set("a", {"v": 3}, ttl_seconds=60)
+    state.cache_set("c", {"v": 4}, ttl_seconds=60)
+    assert state.cache_get("b") is None
+    assert state.cache_get("a") == {"v": 3}
+
+
+def test_cache_key_ignores_argument_key_order():
+    k1 = make_cache_key("s1", "srv", "list_items", {"page": 1, "q": "x"})
+    k2 = make_cache_key("s1", "srv", "list_items", {"q": "x", "page": 1})
+    k3 = make_cache_key("s1", "srv", "list_items", {"page": 2, "q": "x"})
+    assert k1 == k2
+    assert k1 != k3
+    assert k1.startswith("s1:srv:list_items:")
+    assert len(k1.rsplit(":", 1)[1]) == 32
+
+
+def test_cache_key_treats_missing_arguments_as_empty_object():
+    assert make_cache_key("s1", "srv", "t", None) == make_cache_key("s1", "srv", "t", {})
+
+
 def test_history_invalidate_prefix_removes_expected_entries():
     state = ProxyState(max_cache_entries=10)
     state.history_set("cache_raw:s1:srv:key1", {"a": 1})
@@ -52,6 +95,17 @@ def test_history_invalidate_prefix_removes_expected_entries():
     assert state.history_get("cache_raw:s2:srv:key3") == {"a": 3}
 
 
+def test_history_get_clones_unless_read_only():
+    state = ProxyState(max_cache_entries=10)
+    state.history_set("k", {"nested": {"value": 1}})
+    cloned = state.history_get("k")
+    cloned["nested"]["value"] = 999
+    shared = state.history_get("k", clone=False)
+    assert shared == {"nested": {"value": 1}}
+    assert state.history_get("k", clone=False) is shared
+    assert state.history_get("missing", clone=False) is None
+
+
 def test_search_tools_returns_ranked_matches():
     state = ProxyState(max_cache_entries=10)
     state.set_tools(
@@ -74,6 +128,15 @@ def test_search_tools_returns_ranked_matches():
     assert "inputSchema" not in matches[0]
 
 
+def test_search_tools_reflects_latest_set_tools():
+    state = ProxyState(max_cache_entries=10)
+    state.set_tools([{"name": "list_issues", "description": "List issues"}])
+    assert state.search_tools("issue", include_schemas=False)[0]["name"] == "list_issues"
+    state.set_tools([{"name": "create_pull_request", "description": "Open a PR"}])
+    matches = state.search_tools("pull", include_schemas=False)
+    assert [m["name"] for m in matches] == ["create_pull_request"]
+
+
 def test_tools_hash_state_tracks_last_hash_and_hits():
     state = ProxyState(max_cache_entries=10)
     key = "session:server:profile"
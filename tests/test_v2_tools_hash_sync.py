@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -9,7 +10,12 @@ from ultra_lean_mcp_proxy.config import ProxyConfig
 from ultra_lean_mcp_proxy.proxy import ProxyMetrics, _client_supports_tools_hash_sync, _handle_tools_list_result
 from ultra_lean_mcp_proxy.result_compression import TokenCounter
 from ultra_lean_mcp_proxy.state import ProxyState, clone_json
-from ultra_lean_mcp_proxy.tools_hash_sync import canonical_tools_json, compute_tools_hash, parse_if_none_match
+from ultra_lean_mcp_proxy.tools_hash_sync import (
+    TOOLS_HASH_WIRE_RE,
+    canonical_tools_json,
+    compute_tools_hash,
+    parse_if_none_match,
+)
 
 
 def _sample_tools_result(version: int = 1) -> dict:
@@ -91,6 +97,24 @@ def test_tools_hash_server_fingerprint_binding_changes_hash():
     assert bound_a != bound_b
 
 
+def test_tools_hash_server_fingerprint_preimage_layout():
+    tools = [{"name": "x", "description": "d\u00e9"}]
+    preimage = '{"tools":[{"description":"d\u00e9","name":"x"}],"server_fingerprint":"srv-a"}'
+    expected = "sha256:" + hashlib.sha256(preimage.encode("utf-8")).hexdigest()
+    assert compute_tools_hash(tools, include_server_fingerprint=True, server_fingerprint="srv-a") == expected
+
+
+def test_tools_hash_blake2_algorithms_keep_wire_format():
+    tools = _sample_tools_result()["tools"]
+    for algorithm in ("blake2b", "blake2s"):
+        wire = compute_tools_hash(tools, algorithm=algorithm)
+        assert wire != compute_tools_hash(tools)
+        assert parse_if_none_match(wire, expected_algorithm=algorithm) == wire
+        assert parse_if_none_match(wire) is None
+        bound = compute_tools_hash(tools, algorithm=algorithm, include_server_fingerprint=True, server_fingerprint="srv-a")
+        assert bound != wire
+
+
 def test_parse_if_none_match_contract():
     valid = "sha256:" + ("a" * 64)
     assert parse_if_none_match(valid) == valid
@@ -100,6 +124,35 @@ def test_parse_if_none_match_contract():
     assert parse_if_none_match(123) is None
 
 
+def test_parse_if_none_match_agrees_with_wire_regex():
+    hex64 = "0123456789abcdef" * 4
+    candidates = [
+        "sha256:" + hex64,
+        "SHA256:" + hex64.upper(),
+        "  blake2b:" + hex64 + "\n",
+        "sha256:" + hex64 + "\n",
+        "sha256" + hex64,
+        "sha256:" + hex64[:-1],
+        "sha256:" + hex64 + "0",
+        ":" + hex64,
+        "sha-256:" + hex64,
+        "sha256:" + hex64 + ":",
+        "sha256:" + hex64[:-1] + "g",
+        "sha256:" + hex64[:-1] + "\u0663",
+        "sha256:" + hex64[:-1] + "\uff11",
+        "sha\u0663\u0665\u0666:" + hex64,
+        "\u0130:" + hex64,
+        "sha256:" + hex64[:-1] + "\u212a",
+        "sha256:\n" + hex64,
+        "",
+    ]
+    for value in candidates:
+        normalized = value.strip().lower()
+        algorithm = normalized.partition(":")[0]
+        expected = normalized if TOOLS_HASH_WIRE_RE.fullmatch(normalized) else None
+        assert parse_if_none_match(value, expected_algorithm=algorithm) == expected, repr(value)
+
+
 def test_client_capability_handshake_detection():
     assert _client_supports_tools_hash_sync(
         {